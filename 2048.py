@@ -1,11 +1,26 @@
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-import random
+from tkinter import filedialog, messagebox, simpledialog
 import json
 import os
 import time
-from pygame import mixer
+from collections import deque
 from datetime import datetime
+from ai import ExpectimaxAgent, GreedyAgent, RandomAgent, play
+from audio import SoundPlayer
+from bitboard import get_exponent, to_bitboard
+from engine import Game2048Engine
+from journal import JOURNAL_DIR, GameJournal, latest_unfinished, read_journal
+from move_tables import tile_paths
+from persistence import HighScoreStore
+from replay import Replay
+from save_catalog import SAVE_DIR, SORT_ORDERS, SaveCatalog, save_metadata
+from savefile import BINARY_EXTENSION, read_save, write_save
+from worker import EngineWorker
+
+DIRECTION_NAMES = ["Up", "Right", "Down", "Left"]
+
+# When several sounds fall in one move or frame, only the highest one plays
+SOUND_PRIORITY = {"move": 0, "merge": 1, "tutorial": 2}
 
 class Game2048Tkinter:
     def __init__(self, root):
@@ -16,8 +31,13 @@ class Game2048Tkinter:
         self.grid_size = 4  
         self.cell_size = 100
         self.padding = 10
+        self.engine = Game2048Engine()
         self.score = 0
+        self.high_score_store = HighScoreStore()
         self.high_score = self.load_high_score()
+        self.save_catalog = SaveCatalog()
+        self.saves_per_page = 15
+        self.journal = GameJournal()
         self.moves_count = 0
         self.start_time = time.time()
         self.game_active = True
@@ -32,9 +52,60 @@ class Game2048Tkinter:
             "Tutorial complete! Try to reach 2048 on your own now."
         ]
         
-        # Initialize sound mixer
-        mixer.init()
-        self.load_sounds()
+        # Searches run on a background thread so the window stays responsive
+        self.worker = EngineWorker(self.root)
+        self.hint_agent = ExpectimaxAgent(depth=3)
+        self.hint_job = None
+        self.hint_direction = None
+        
+        # Autoplay runs the engine flat out and redraws at most this often
+        self.autoplay_fps = 30
+        # Random and Greedy play tens of thousands of moves per second;
+        # Expectimax plays far stronger at a few hundred
+        self.autoplay_agents = {
+            "Random": RandomAgent,
+            "Greedy": GreedyAgent,
+            "Expectimax (slow)": lambda: ExpectimaxAgent(depth=2),
+        }
+        self.autoplay_agent_name = tk.StringVar(self.root, value="Greedy")
+        self.autoplay_job = None
+        self.autoplay_frame_id = None
+        
+        # Keyboard moves are queued and applied at most moves_per_frame
+        # every input_interval ms, so key repeat cannot build a backlog
+        self.input_queue = deque()
+        self.max_queued_moves = 3
+        self.moves_per_frame = 2
+        self.input_interval = 1000 // 30
+        self.input_after_id = None
+        
+        # Slide animations run in one after() loop at up to 60 fps
+        self.animations_enabled = True
+        self.animation_duration = 0.1
+        self.frame_interval = 1000 // 60
+        self.frame_budget = 8
+        self.animation = None
+        self.animation_merges = ()
+        self.animation_after_id = None
+        self.last_paths = None
+        
+        # One timer restores the cells flashed by the latest merge
+        self.flash_cells = ()
+        self.flash_after_id = None
+        
+        # Replays show a recorded game on the board while the live one waits
+        self.replay = None
+        self.live_state = None
+        self.replay_speeds = ["0.5x", "1x", "2x", "4x", "16x", "64x"]
+        self.replay_speed = tk.StringVar(self.root, value="1x")
+        self.replay_moves_per_second = 8
+        self.replay_anchor = (0, 0.0)
+        self.replay_after_id = None
+        
+        # Sound is initialized in the background once the window is up
+        self.sound_player = SoundPlayer()
+        self.root.after_idle(self.sound_player.start)
+        self.pending_sound = None
         
         
         self.setup_colors()
@@ -44,12 +115,37 @@ class Game2048Tkinter:
         self.root.minsize(400, 500)
         self.setup_menu()
         
-       
-        self.initialize_game()
+        # Pick up an unfinished game from its journal, or start a new one
+        if not self.restore_journal():
+            self.initialize_game()
         
         
         self.setup_key_bindings()
     
+    @property
+    def grid(self):
+        return self.engine.grid
+
+    @grid.setter
+    def grid(self, value):
+        self.engine.grid = value
+
+    @property
+    def score(self):
+        return self.engine.score
+
+    @score.setter
+    def score(self, value):
+        self.engine.score = value
+
+    @property
+    def moves_count(self):
+        return self.engine.moves_count
+
+    @moves_count.setter
+    def moves_count(self, value):
+        self.engine.moves_count = value
+    
     def setup_colors(self):
         """Configure the color scheme for the game"""
         self.bg_color = "#121212"  
@@ -57,6 +153,10 @@ class Game2048Tkinter:
         self.text_color = "#FFFFFF"  
         self.empty_color = "#2D2D2D"  
         self.tutorial_highlight = "#FFD700"  
+        self.hint_highlight = "#4FC3F7"
+        self.merge_highlight = "#FFD700"
+        
+        self.instructions_text = "Controls: Arrow keys, WASD, or 2/4/6/8 to move. R=Restart, H=Hint, P=Autoplay"
         
         # Different colors for different tile values
         self.tile_colors = {
@@ -76,6 +176,9 @@ class Game2048Tkinter:
             1024: "#FFFFFF", 2048: "#FFFFFF", 4096: "#FFFFFF",
             8192: "#FFFFFF", 16384: "#FFFFFF", 32768: "#FFFFFF"
         }
+        
+        # Canvas item options per tile value, filled in by tile_style
+        self.tile_styles = {}
     
     def setup_menu(self):
         """Create the game menu"""
@@ -84,10 +187,23 @@ class Game2048Tkinter:
         # Game menu
         game_menu = tk.Menu(menubar, tearoff=0)
         game_menu.add_command(label="New Game", command=self.reset_game)
+        game_menu.add_command(label="New Seeded Game...", command=self.new_seeded_game)
         game_menu.add_command(label="Tutorial Mode", command=self.start_tutorial)
+        game_menu.add_command(label="Hint", command=self.show_hint)
+        game_menu.add_command(label="Cancel Computation", command=self.cancel_computation)
+        
+        # Autoplay submenu
+        autoplay_menu = tk.Menu(game_menu, tearoff=0)
+        for name in self.autoplay_agents:
+            autoplay_menu.add_radiobutton(label=name, variable=self.autoplay_agent_name, value=name)
+        autoplay_menu.add_separator()
+        autoplay_menu.add_command(label="Start Autoplay", command=self.start_autoplay)
+        autoplay_menu.add_command(label="Stop Autoplay", command=self.stop_autoplay)
+        game_menu.add_cascade(label="Autoplay", menu=autoplay_menu)
         game_menu.add_separator()
         game_menu.add_command(label="Save Game", command=self.save_game)
         game_menu.add_command(label="Load Game", command=self.load_game)
+        game_menu.add_command(label="Watch Replay...", command=self.open_replay)
         game_menu.add_separator()
         game_menu.add_command(label="Statistics", command=self.show_statistics)
         game_menu.add_separator()
@@ -102,35 +218,96 @@ class Game2048Tkinter:
         
         self.root.config(menu=menubar)
     
-    def initialize_game(self):
-        """Initialize or reinitialize the game board"""
-        # Clear existing widgets if they exist
-        if hasattr(self, 'score_frame'):
-            self.score_frame.destroy()
-        if hasattr(self, 'grid_frame'):
-            self.grid_frame.destroy()
-        if hasattr(self, 'instructions'):
-            self.instructions.destroy()
-        if hasattr(self, 'tutorial_label'):
-            self.tutorial_label.destroy()
+    def initialize_game(self, seed=None):
+        """Initialize or reinitialize the game board, spawning from seed if given"""
+        self.close_replay()
+        self.cancel_computation()
         
         # Reset game state
-        self.grid = [[0]*self.grid_size for _ in range(self.grid_size)]
-        self.score = 0
-        self.moves_count = 0
+        self.engine.reset(seed)
         self.start_time = time.time()
         self.game_active = True
         self.tutorial_mode = False
         self.tutorial_step = 0
+        self.hint_direction = None
         
-        # Create widgets
-        self.create_widgets()
+        # Create widgets, or reset the existing ones in place
+        self.ensure_widgets()
         
         # Add initial tiles
         self.add_random_tile()
         self.add_random_tile()
+        self.journal.start(self.engine, self.start_time)
         self.update_ui()
     
+    def restore_journal(self):
+        """Replay the journal of a game left unfinished, returning if there was one"""
+        path = latest_unfinished()
+        if path is None:
+            return False
+        
+        try:
+            state, records = read_journal(path)
+            engine = Game2048Engine(state["seed"])
+            engine.board = state["board"]
+            engine.score = state["score"]
+            engine.moves_count = state["moves_count"]
+            engine.spawn_count = state["spawn_count"]
+            engine.replay(records)
+        except Exception:
+            return False
+        if engine.is_game_over():
+            return False
+        
+        self.engine = engine
+        self.start_time = state["start_time"]
+        self.game_active = True
+        self.tutorial_mode = False
+        self.tutorial_step = 0
+        self.hint_direction = None
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.save_high_score()
+        self.journal.resume(path, engine)
+        
+        self.ensure_widgets()
+        self.update_ui()
+        return True
+    
+    def ensure_widgets(self):
+        """Create the widgets, or reset the existing ones if the layout still fits"""
+        if getattr(self, 'built_grid_size', None) == self.grid_size:
+            self.reset_widgets()
+            return
+        
+        # Clear existing widgets if they exist
+        if hasattr(self, 'score_frame'):
+            self.score_frame.destroy()
+        if hasattr(self, 'grid_frame'):
+            self.grid_frame.destroy()
+        if hasattr(self, 'instructions'):
+            self.instructions.destroy()
+        if hasattr(self, 'tutorial_label'):
+            self.tutorial_label.destroy()
+        if hasattr(self, 'replay_frame'):
+            self.replay_frame.destroy()
+        
+        self.create_widgets()
+        self.built_grid_size = self.grid_size
+    
+    def reset_widgets(self):
+        """Return the existing widgets to their new-game state"""
+        self.cancel_animation()
+        self.cancel_merge_flash()
+        self.input_queue.clear()
+        self.tutorial_label.pack_forget()
+        self.tutorial_label.config(text="")
+        self.instructions.config(text=self.instructions_text)
+        
+        # Force every cell and label to be redrawn by the next update_ui
+        self.rendered_values = [[None]*self.grid_size for _ in range(self.grid_size)]
+        self.rendered_labels = None
+    
     def create_widgets(self):
         """Create all the game widgets"""
         # Score display
@@ -169,24 +346,38 @@ class Game2048Tkinter:
         self.grid_frame = tk.Frame(self.root, bg=self.frame_bg)
         self.grid_frame.pack(padx=10, pady=10)
         
+        # One canvas holds every tile; each cell owns a rectangle and a text item
+        board_size = self.grid_size * (self.cell_size + self.padding) + self.padding
+        self.board_canvas = tk.Canvas(
+            self.grid_frame,
+            width=board_size,
+            height=board_size,
+            bg=self.frame_bg,
+            highlightthickness=0
+        )
+        self.board_canvas.pack()
+        
         self.cells = []
         for i in range(self.grid_size):
             row = []
             for j in range(self.grid_size):
-                cell = tk.Label(
-                    self.grid_frame, 
-                    text="", 
-                    width=4, 
-                    height=2, 
-                    font=("Arial", 24, "bold"), 
-                    relief="raised",
-                    bg=self.empty_color,
-                    fg=self.text_color
+                x0, y0, x1, y1 = self.cell_bounds(i, j)
+                rect = self.board_canvas.create_rectangle(
+                    x0, y0, x1, y1, fill=self.empty_color, outline=""
+                )
+                text = self.board_canvas.create_text(
+                    (x0 + x1) / 2, (y0 + y1) / 2,
+                    text="",
+                    font=("Arial", 24, "bold"),
+                    fill=self.text_color
                 )
-                cell.grid(row=i, column=j, padx=self.padding, pady=self.padding)
-                row.append(cell)
+                row.append((rect, text))
             self.cells.append(row)
         
+        # Last value drawn in each cell, None when the cell must be redrawn
+        self.rendered_values = [[None]*self.grid_size for _ in range(self.grid_size)]
+        self.rendered_labels = None
+        
         # Tutorial label
         self.tutorial_label = tk.Label(
             self.root,
@@ -197,16 +388,42 @@ class Game2048Tkinter:
             wraplength=400
         )
         
+        # Replay controls, shown below the board while a replay is open
+        self.replay_frame = tk.Frame(self.root, bg=self.bg_color)
+        self.replay_play_button = tk.Button(self.replay_frame, text="Play", width=6, command=self.toggle_replay)
+        self.replay_play_button.pack(side=tk.LEFT, padx=5)
+        tk.OptionMenu(self.replay_frame, self.replay_speed, *self.replay_speeds,
+                      command=lambda _: self.anchor_replay()).pack(side=tk.LEFT)
+        self.replay_scale = tk.Scale(
+            self.replay_frame,
+            orient=tk.HORIZONTAL,
+            length=200,
+            showvalue=False,
+            bg=self.bg_color,
+            highlightthickness=0,
+            command=self.on_replay_scale
+        )
+        self.replay_scale.pack(side=tk.LEFT, padx=5)
+        self.replay_label = tk.Label(self.replay_frame, width=14, bg=self.bg_color, fg=self.text_color)
+        self.replay_label.pack(side=tk.LEFT)
+        tk.Button(self.replay_frame, text="Exit", command=self.close_replay).pack(side=tk.LEFT, padx=5)
+        
         # Instructions
         self.instructions = tk.Label(
             self.root, 
-            text="Controls: Arrow keys, WASD, or 2/4/6/8 to move. R=Restart", 
+            text=self.instructions_text, 
             font=("Arial", 10), 
             bg=self.bg_color, 
             fg=self.text_color
         )
         self.instructions.pack(pady=10)
     
+    def cell_bounds(self, i, j):
+        """Return the canvas rectangle (x0, y0, x1, y1) of cell (i, j)"""
+        x0 = self.padding + j * (self.cell_size + self.padding)
+        y0 = self.padding + i * (self.cell_size + self.padding)
+        return x0, y0, x0 + self.cell_size, y0 + self.cell_size
+    
     def setup_key_bindings(self):
         """Set up all keyboard bindings"""
         # Movement keys
@@ -217,23 +434,29 @@ class Game2048Tkinter:
         ]
         
         for key, direction in movement_bindings:
-            self.root.bind(key, lambda e, d=direction: self.move(d))
+            self.root.bind(key, lambda e, d=direction: self.queue_move(d))
         
         # Function keys
         self.root.bind("r", lambda e: self.reset_game())
+        self.root.bind("h", lambda e: self.show_hint())
+        self.root.bind("<Escape>", lambda e: self.cancel_computation())
+        self.root.bind("p", lambda e: self.start_autoplay())
+        self.root.bind("<space>", lambda e: self.toggle_replay())
         self.root.bind("0", lambda e: self.exit_game())
     
     def start_tutorial(self):
         """Start the tutorial mode"""
         self.reset_game()
+        self.journal.end()
         self.tutorial_mode = True
         self.tutorial_step = 0
         
         # Set up initial tutorial grid
-        self.grid = [[0]*self.grid_size for _ in range(self.grid_size)]
-        self.grid[0][0] = 2
-        self.grid[0][1] = 2
-        self.grid[1][0] = 4
+        grid = [[0]*self.grid_size for _ in range(self.grid_size)]
+        grid[0][0] = 2
+        grid[0][1] = 2
+        grid[1][0] = 4
+        self.grid = grid
         self.update_ui()
         
         # Show tutorial label
@@ -252,77 +475,184 @@ class Game2048Tkinter:
     
     def highlight_tutorial_tiles(self):
         """Highlight tiles relevant to the current tutorial step"""
-        # Reset all highlights first
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                value = self.grid[i][j]
-                self.cells[i][j].config(bg=self.tile_colors.get(value, self.empty_color))
+        grid = self.grid
         
+        # Highlighted cells are marked dirty, so the next update_ui resets them
         if self.tutorial_step == 1:  # Right move
             for j in range(self.grid_size):
-                if self.grid[0][j] != 0:
-                    self.cells[0][j].config(bg=self.tutorial_highlight)
+                if grid[0][j] != 0:
+                    self.highlight_cell(0, j, self.tutorial_highlight)
         elif self.tutorial_step == 3:  # Up move
             for i in range(self.grid_size):
-                if self.grid[i][0] != 0:
-                    self.cells[i][0].config(bg=self.tutorial_highlight)
+                if grid[i][0] != 0:
+                    self.highlight_cell(i, 0, self.tutorial_highlight)
     
-    def load_sounds(self):
-        """Initialize sound effects"""
-        self.sound_enabled = True
-        try:
-            # Try to load sounds, use silent mode if files not found
-            self.move_sound = mixer.Sound("sounds/move.wav") if os.path.exists("sounds/move.wav") else None
-            self.merge_sound = mixer.Sound("sounds/merge.wav") if os.path.exists("sounds/merge.wav") else None
-            self.game_over_sound = mixer.Sound("sounds/game_over.wav") if os.path.exists("sounds/game_over.wav") else None
-            self.win_sound = mixer.Sound("sounds/win.wav") if os.path.exists("sounds/win.wav") else None
-            self.tutorial_sound = mixer.Sound("sounds/tutorial.wav") if os.path.exists("sounds/tutorial.wav") else None
-        except:
-            self.sound_enabled = False
-    
-    def play_sound(self, sound_type):
+    def highlight_cell(self, i, j, color):
+        """Recolour a cell until the next update_ui redraws it"""
+        self.board_canvas.itemconfigure(self.cells[i][j][0], fill=color)
+        self.rendered_values[i][j] = None
+    
+    def show_hint(self):
+        """Start a background search for the best move"""
+        if not self.game_active:
+            return
+        
+        self.cancel_computation()
+        board = self.engine.board
+        if not self.engine.legal_moves():
+            messagebox.showinfo("Hint", "No moves available.")
+            return
+        
+        self.hint_job = self.worker.submit(
+            lambda job: self.hint_agent.choose_move(board, job.should_stop),
+            lambda direction: self.on_hint_ready(board, direction)
+        )
+        self.instructions.config(text="Hint: thinking... (Esc to cancel)")
+    
+    def on_hint_ready(self, board, direction):
+        """Show a finished hint if the board has not changed meanwhile"""
+        self.hint_job = None
+        self.instructions.config(text=self.instructions_text)
+        if direction is None or board != self.engine.board:
+            return
+        
+        self.highlight_hint(direction)
+    
+    def cancel_computation(self):
+        """Cancel a running hint search or autoplay"""
+        if self.hint_job is not None:
+            self.hint_job.cancel()
+            self.hint_job = None
+            self.instructions.config(text=self.instructions_text)
+        self.stop_autoplay()
+    
+    def start_autoplay(self):
+        """Let the selected agent play the current game in the background"""
+        if not self.game_active or self.tutorial_mode or self.autoplay_job is not None:
+            return
+        
+        self.cancel_computation()
+        name = self.autoplay_agent_name.get()
+        agent = self.autoplay_agents[name]()
+        engine = self.engine.copy()
+        self.autoplay_job = self.worker.submit(
+            lambda job: play(engine, agent, job.should_stop, lambda e: job.report(e.copy())),
+            self.on_autoplay_finished
+        )
+        self.instructions.config(text=f"Autoplay: {name} (press a move key or Esc to stop)")
+        self.autoplay_frame_id = self.root.after(1000 // self.autoplay_fps, self.autoplay_frame)
+    
+    def autoplay_frame(self):
+        """Show the latest autoplay position, once per frame"""
+        self.autoplay_frame_id = None
+        if self.autoplay_job is None:
+            return
+        
+        self.adopt_engine(self.autoplay_job.progress)
+        self.autoplay_frame_id = self.root.after(1000 // self.autoplay_fps, self.autoplay_frame)
+    
+    def adopt_engine(self, engine):
+        """Replace the game state with a position reached in the background"""
+        if engine is None:
+            return
+        
+        self.engine = engine
+        self.journal.update(engine.history)
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.save_high_score()
+        self.update_ui()
+    
+    def end_autoplay(self):
+        """Stop the autoplay frame loop and restore the instructions"""
+        self.autoplay_job = None
+        if self.autoplay_frame_id is not None:
+            self.root.after_cancel(self.autoplay_frame_id)
+            self.autoplay_frame_id = None
+        self.instructions.config(text=self.instructions_text)
+    
+    def stop_autoplay(self):
+        """Stop autoplay and keep the last position it reported"""
+        job = self.autoplay_job
+        if job is None:
+            return
+        
+        job.cancel()
+        self.end_autoplay()
+        self.adopt_engine(job.progress)
+    
+    def on_autoplay_finished(self, engine):
+        """Show the final autoplay position and end the game if it is lost
+        
+        engine is None if autoplay failed; its last reported position is kept.
+        """
+        job = self.autoplay_job
+        self.end_autoplay()
+        if engine is None and job is not None:
+            engine = job.progress
+        self.adopt_engine(engine)
+        if self.is_game_over():
+            self.game_over()
+    
+    def highlight_hint(self, direction):
+        """Highlight the edge of the grid that tiles should move towards"""
+        self.hint_direction = direction
+        last = self.grid_size - 1
+        if direction == 0:
+            edge = [(0, j) for j in range(self.grid_size)]
+        elif direction == 1:
+            edge = [(i, last) for i in range(self.grid_size)]
+        elif direction == 2:
+            edge = [(last, j) for j in range(self.grid_size)]
+        else:
+            edge = [(i, 0) for i in range(self.grid_size)]
+        
+        for i, j in edge:
+            self.highlight_cell(i, j, self.hint_highlight)
+        self.instructions.config(text=f"Hint: move {DIRECTION_NAMES[direction]}")
+    
+    def clear_hint(self):
+        """Remove the hint message once the board has changed"""
+        if self.hint_direction is not None:
+            self.hint_direction = None
+            self.instructions.config(text=self.instructions_text)
+    
+    def play_sound(self, sound_type, level=0):
         """Play the specified sound effect"""
-        if not self.sound_enabled or not self.game_active:
+        if not self.game_active:
             return
             
-        try:
-            if sound_type == "move" and self.move_sound:
-                self.move_sound.play()
-            elif sound_type == "merge" and self.merge_sound:
-                self.merge_sound.play()
-            elif sound_type == "game_over" and self.game_over_sound:
-                self.game_over_sound.play()
-            elif sound_type == "win" and self.win_sound:
-                self.win_sound.play()
-            elif sound_type == "tutorial" and self.tutorial_sound:
-                self.tutorial_sound.play()
-        except:
-            pass
+        self.sound_player.play(sound_type, level)
+    
+    def queue_sound(self, sound_type, level=0):
+        """Keep only the most important sound event until flush_sounds"""
+        event = (SOUND_PRIORITY[sound_type], level, sound_type)
+        if self.pending_sound is None or event > self.pending_sound:
+            self.pending_sound = event
+    
+    def flush_sounds(self):
+        """Play the single sound collected for the latest moves"""
+        if self.pending_sound is not None:
+            priority, level, sound_type = self.pending_sound
+            self.pending_sound = None
+            self.play_sound(sound_type, level)
     
     def load_high_score(self):
         """Load the high score from file"""
-        try:
-            if os.path.exists("highscore.json"):
-                with open("highscore.json", "r") as f:
-                    data = json.load(f)
-                    return data.get("high_score", 0)
-        except:
-            return 0
-        return 0
+        return self.high_score_store.load()
     
     def save_high_score(self):
-        """Save the high score to file"""
-        try:
-            with open("highscore.json", "w") as f:
-                json.dump({"high_score": self.high_score}, f)
-        except:
-            pass
+        """Save the high score to file in the background"""
+        self.high_score_store.save(self.high_score)
     
     def save_game(self):
         """Save the current game state to a file with player-chosen name"""
         if self.tutorial_mode:
             messagebox.showinfo("Cannot Save", "Cannot save game during tutorial mode.")
             return
+        if self.replay is not None:
+            messagebox.showinfo("Cannot Save", "Cannot save game while watching a replay.")
+            return
             
         game_state = {
             "grid": self.grid,
@@ -330,31 +660,38 @@ class Game2048Tkinter:
             "high_score": self.high_score,
             "moves_count": self.moves_count,
             "start_time": self.start_time,
-            "elapsed_time": time.time() - self.start_time
+            "elapsed_time": time.time() - self.start_time,
+            "saved_at": time.time(),
+            "seed": self.engine.seed,
+            "spawn_count": self.engine.spawn_count
         }
         
         try:
             # Ask player for save file name
             save_name = simpledialog.askstring(
                 "Save Game",
-                "Enter a name for your saved game:",
+                "Enter a name for your saved game\n"
+                f"(end it with {BINARY_EXTENSION} for the compact binary format):",
                 parent=self.root
             )
             
             if not save_name:
                 return  
 
-            if not save_name.lower().endswith('.json'):
+            if not save_name.lower().endswith(('.json', BINARY_EXTENSION)):
                 save_name += '.json'
             
             
-            save_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),  "saved")
-            os.makedirs(save_dir, exist_ok=True)
+            os.makedirs(SAVE_DIR, exist_ok=True)
 
-            filename = os.path.join(save_dir, save_name)
+            filename = os.path.join(SAVE_DIR, save_name)
             
-            with open(filename, "w") as f:
-                json.dump(game_state, f)
+            if save_name.lower().endswith(BINARY_EXTENSION):
+                write_save(filename, game_state, self.engine.move_log)
+            else:
+                with open(filename, "w") as f:
+                    json.dump(game_state, f)
+            self.save_catalog.record(save_name, save_metadata(game_state))
             messagebox.showinfo("Game Saved", f"Game successfully saved to {filename}")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save game: {str(e)}")
@@ -363,61 +700,54 @@ class Game2048Tkinter:
         """Load a game state from a file"""
         try:
 
-            save_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "2048", "saved")
-            os.makedirs(save_dir, exist_ok=True)
-
-            save_files = [f for f in os.listdir(save_dir) if f.endswith(".json")]
-            
-            if not save_files:
+            self.save_catalog.refresh()
+            if not self.save_catalog.sorted_entries():
                 messagebox.showinfo("No Saved Games", "No saved games found.")
                 return
             
-            selected_file = simpledialog.askstring(
-                "Load Game",
-                "Enter save file name:\n\n" + "\n".join(save_files),
-                parent=self.root
-            )
-            
+            selected_file = self.choose_saved_game()
             if not selected_file:
                 return
                 
             # Construct full path
-            full_path = os.path.join(save_dir, selected_file)
+            full_path = os.path.join(SAVE_DIR, selected_file)
             
             if not os.path.exists(full_path):
                 messagebox.showerror("Load Error", "File not found.")
                 return
             
-            with open(full_path, "r") as f:
-                game_state = json.load(f)
+            game_state = read_save(full_path)
             
             if not all(key in game_state for key in ["grid", "score", "moves_count"]):
                 messagebox.showerror("Load Error", "Invalid save file format.")
                 return
             
-            if hasattr(self, 'score_frame'):
-                self.score_frame.destroy()
-            if hasattr(self, 'grid_frame'):
-                self.grid_frame.destroy()
-            if hasattr(self, 'instructions'):
-                self.instructions.destroy()
-            if hasattr(self, 'tutorial_label'):
-                self.tutorial_label.destroy()
+            # Packing validates the grid before the current game is torn down
+            board = game_state.get("board")
+            if board is None:
+                board = to_bitboard(game_state["grid"])
+            self.close_replay()
+            self.cancel_computation()
             
-            # Set the game state
-            self.grid = game_state["grid"]
+            # Set the game state; saves without a seed continue on a fresh one
+            self.engine.reset(game_state.get("seed"))
+            self.engine.spawn_count = game_state.get("spawn_count", 0)
+            self.engine.board = board
             self.score = game_state["score"]
             self.high_score = game_state.get("high_score", self.load_high_score())
             self.moves_count = game_state["moves_count"]
+            self.engine.history = bytearray(game_state.get("move_log", b""))
             self.tutorial_mode = False
+            self.hint_direction = None
             
             # Adjust start time based on elapsed time
             elapsed = game_state.get("elapsed_time", 0)
             self.start_time = time.time() - elapsed
             self.game_active = True
+            self.journal.start(self.engine, self.start_time)
             
-            # Create widgets
-            self.create_widgets()
+            # Reuse the existing widgets
+            self.ensure_widgets()
             self.update_ui()
             
             messagebox.showinfo("Game Loaded", "Game successfully loaded.")
@@ -425,38 +755,357 @@ class Game2048Tkinter:
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load game: {str(e)}")
     
+    def choose_saved_game(self):
+        """Show a sortable, paged list of saved games and return the chosen name"""
+        dialog = tk.Toplevel(self.root, bg=self.bg_color)
+        dialog.title("Load Game")
+        dialog.transient(self.root)
+        
+        sort_order = tk.StringVar(dialog, value="Newest")
+        state = {"page": 0, "names": [], "choice": None}
+        
+        listbox = tk.Listbox(
+            dialog,
+            width=64,
+            height=self.saves_per_page,
+            font=("Courier", 10),
+            bg=self.frame_bg,
+            fg=self.text_color
+        )
+        page_label = tk.Label(dialog, bg=self.bg_color, fg=self.text_color)
+        
+        def show_page():
+            entries, page_count = self.save_catalog.page(
+                state["page"], self.saves_per_page, sort_order.get()
+            )
+            state["page"] = min(state["page"], page_count - 1)
+            state["names"] = [entry["name"] for entry in entries]
+            listbox.delete(0, tk.END)
+            for entry in entries:
+                saved_at = datetime.fromtimestamp(entry["timestamp"]).strftime("%Y-%m-%d %H:%M")
+                listbox.insert(tk.END, (
+                    f"{entry['name'][:20]:<20} {entry['score']:>7} "
+                    f"{entry['max_tile']:>6} {entry['moves']:>6}  {saved_at}"
+                ))
+            page_label.config(text=f"Page {state['page'] + 1} of {page_count}")
+        
+        def change_page(step):
+            state["page"] = max(0, state["page"] + step)
+            show_page()
+        
+        def change_order(_):
+            state["page"] = 0
+            show_page()
+        
+        def choose(_=None):
+            selection = listbox.curselection()
+            if selection:
+                state["choice"] = state["names"][selection[0]]
+                dialog.destroy()
+        
+        controls = tk.Frame(dialog, bg=self.bg_color)
+        tk.Label(controls, text="Sort by:", bg=self.bg_color, fg=self.text_color).pack(side=tk.LEFT)
+        tk.OptionMenu(controls, sort_order, *SORT_ORDERS, command=change_order).pack(side=tk.LEFT)
+        tk.Button(controls, text="< Prev", command=lambda: change_page(-1)).pack(side=tk.LEFT, padx=5)
+        tk.Button(controls, text="Next >", command=lambda: change_page(1)).pack(side=tk.LEFT)
+        controls.pack(padx=10, pady=5)
+        
+        tk.Label(
+            dialog,
+            text=f"{'Name':<20} {'Score':>7} {'Tile':>6} {'Moves':>6}  Saved",
+            font=("Courier", 10),
+            bg=self.bg_color,
+            fg=self.text_color
+        ).pack(padx=10, anchor="w")
+        listbox.pack(padx=10)
+        listbox.bind("<Double-Button-1>", choose)
+        page_label.pack(pady=5)
+        
+        buttons = tk.Frame(dialog, bg=self.bg_color)
+        tk.Button(buttons, text="Load", command=choose).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        buttons.pack(pady=10)
+        
+        show_page()
+        dialog.grab_set()
+        self.root.wait_window(dialog)
+        return state["choice"]
+    
+    def open_replay(self):
+        """Let the player pick a game journal and watch it on the board"""
+        self.journal.flush()
+        path = filedialog.askopenfilename(
+            parent=self.root,
+            title="Watch Replay",
+            initialdir=JOURNAL_DIR,
+            filetypes=[("Game journals", "*.jnl"), ("All files", "*")]
+        )
+        if not path:
+            return
+        
+        try:
+            replay = Replay.from_journal(path)
+        except Exception as e:
+            messagebox.showerror("Replay Error", f"Failed to open replay: {str(e)}")
+            return
+        self.start_replay(replay)
+    
+    def start_replay(self, replay):
+        """Show a replay on the board, keeping the live game aside until it closes"""
+        self.close_replay()
+        self.cancel_computation()
+        self.finish_animation()
+        self.input_queue.clear()
+        self.clear_hint()
+        
+        self.live_state = (self.engine, self.game_active)
+        self.replay = replay
+        self.game_active = False
+        self.replay_scale.config(to=replay.length)
+        self.replay_frame.pack(before=self.instructions, pady=5)
+        self.instructions.config(text="Replay: Space to play or pause, drag the slider to seek")
+        self.show_replay_position(0)
+    
+    def close_replay(self):
+        """Leave the replay and return to the live game"""
+        if self.replay is None:
+            return
+        
+        self.pause_replay()
+        self.replay = None
+        self.engine, self.game_active = self.live_state
+        self.live_state = None
+        self.replay_frame.pack_forget()
+        self.instructions.config(text=self.instructions_text)
+        self.update_ui()
+    
+    def show_replay_position(self, position):
+        """Draw the replay at a move number"""
+        self.engine = self.replay.seek(position)
+        self.update_ui()
+        self.replay_scale.set(self.replay.position)
+        self.replay_label.config(text=f"Move {self.replay.position} / {self.replay.length}")
+    
+    def on_replay_scale(self, value):
+        """Seek when the slider is dragged"""
+        position = int(float(value))
+        if self.replay is None or position == self.replay.position:
+            return
+        
+        self.show_replay_position(position)
+        self.anchor_replay()
+    
+    def anchor_replay(self):
+        """Restart the playback clock from the position on screen"""
+        if self.replay is not None:
+            self.replay_anchor = (self.replay.position, time.perf_counter())
+    
+    def toggle_replay(self):
+        """Play or pause the replay"""
+        if self.replay is None:
+            return
+        
+        if self.replay_after_id is not None:
+            self.pause_replay()
+            return
+        if self.replay.position >= self.replay.length:
+            self.show_replay_position(0)
+        self.anchor_replay()
+        self.replay_play_button.config(text="Pause")
+        self.replay_after_id = self.root.after(self.frame_interval, self.replay_frame_tick)
+    
+    def pause_replay(self):
+        """Stop the playback loop"""
+        if self.replay_after_id is not None:
+            self.root.after_cancel(self.replay_after_id)
+            self.replay_after_id = None
+        self.replay_play_button.config(text="Play")
+    
+    def replay_frame_tick(self):
+        """Advance the replay by the moves due since the playback clock started
+        
+        Positions follow the clock rather than the tick count, so high speeds
+        skip intermediate moves instead of falling behind.
+        """
+        self.replay_after_id = None
+        speed = float(self.replay_speed.get().rstrip("x"))
+        position, started = self.replay_anchor
+        elapsed = time.perf_counter() - started
+        position += int(elapsed * self.replay_moves_per_second * speed)
+        self.show_replay_position(position)
+        
+        if self.replay.position >= self.replay.length:
+            self.pause_replay()
+            return
+        self.replay_after_id = self.root.after(self.frame_interval, self.replay_frame_tick)
+    
     def add_random_tile(self):
         """Add a random tile (2 or 4) to an empty cell"""
         if self.tutorial_mode and self.tutorial_step < 5:
             return 
             
-        empty_cells = [(i, j) for i in range(self.grid_size) 
-                      for j in range(self.grid_size) if self.grid[i][j] == 0]
-        if empty_cells:
-            i, j = random.choice(empty_cells)
-            self.grid[i][j] = 4 if random.random() < 0.3 else 2
+        self.engine.add_random_tile()
     
     def update_ui(self):
         """Update the game interface"""
+        # The board is about to be drawn in full, so any slide is obsolete
+        self.cancel_animation()
+        
+        grid = self.grid
+        rendered = self.rendered_values
+        
+        # Only reconfigure cells whose value changed since the last redraw
         for i in range(self.grid_size):
             for j in range(self.grid_size):
-                value = self.grid[i][j]
-                font_size = self.calculate_font_size(value)
-                self.cells[i][j].config(
-                    text=str(value) if value else "",
-                    bg=self.tile_colors.get(value, self.empty_color),
-                    fg=self.text_colors.get(value, self.text_color),
-                    font=("Arial", font_size, "bold")
-                )
+                value = grid[i][j]
+                if rendered[i][j] != value:
+                    self.draw_cell(i, j, value)
         
-        # Update score and moves
-        self.score_label.config(text=f"Score: {self.score}")
-        self.high_score_label.config(text=f"High Score: {self.high_score}")
-        self.moves_label.config(text=f"Moves: {self.moves_count}")
+        self.update_labels()
 
         if self.tutorial_mode:
             self.highlight_tutorial_tiles()
     
+    def update_labels(self):
+        """Update the score, high score and move counters"""
+        labels = (self.score, self.high_score, self.moves_count)
+        if labels != self.rendered_labels:
+            self.score_label.config(text=f"Score: {self.score}")
+            self.high_score_label.config(text=f"High Score: {self.high_score}")
+            self.moves_label.config(text=f"Moves: {self.moves_count}")
+            self.rendered_labels = labels
+    
+    def draw_cell(self, i, j, value):
+        """Draw a tile value into cell (i, j)"""
+        rect, text = self.cells[i][j]
+        rect_style, text_style = self.tile_style(value)
+        self.board_canvas.itemconfigure(rect, **rect_style)
+        self.board_canvas.itemconfigure(text, **text_style)
+        self.rendered_values[i][j] = value
+    
+    def resize_cell(self, i, j, grow=0):
+        """Grow the rectangle of cell (i, j) by grow pixels on every side"""
+        x0, y0, x1, y1 = self.cell_bounds(i, j)
+        self.board_canvas.coords(self.cells[i][j][0], x0 - grow, y0 - grow, x1 + grow, y1 + grow)
+    
+    def flash_merges(self, positions):
+        """Highlight and pop merged cells until a single timer restores them"""
+        for i, j in positions:
+            self.highlight_cell(i, j, self.merge_highlight)
+            self.resize_cell(i, j, self.padding // 2)
+        if positions:
+            self.flash_cells = positions
+            self.flash_after_id = self.root.after(100, self.end_merge_flash)
+    
+    def cancel_merge_flash(self):
+        """Drop a pending merge highlight timer"""
+        if self.flash_after_id is not None:
+            self.root.after_cancel(self.flash_after_id)
+            self.flash_after_id = None
+        for i, j in self.flash_cells:
+            self.resize_cell(i, j)
+        self.flash_cells = ()
+    
+    def end_merge_flash(self):
+        """Restore only the cells highlighted by the last merge"""
+        self.flash_after_id = None
+        grid = self.grid
+        for i, j in self.flash_cells:
+            self.resize_cell(i, j)
+            self.draw_cell(i, j, grid[i][j])
+        self.flash_cells = ()
+        
+        if self.tutorial_mode:
+            self.highlight_tutorial_tiles()
+    
+    def start_animation(self, paths, merge_positions):
+        """Slide tiles from their old cells to their new ones
+        
+        The engine has already moved; only the picture catches up. Tiles are
+        drawn as temporary canvas items over blanked cells, and the final board
+        is drawn once the slide ends.
+        """
+        self.finish_animation()
+        for i in range(self.grid_size):
+            for j in range(self.grid_size):
+                if self.rendered_values[i][j] != 0:
+                    self.draw_cell(i, j, 0)
+        
+        canvas = self.board_canvas
+        sprites = []
+        for (i, j), (dest_i, dest_j), value in paths:
+            start = self.cell_bounds(i, j)
+            end = self.cell_bounds(dest_i, dest_j)
+            rect_style, text_style = self.tile_style(value)
+            rect = canvas.create_rectangle(*start, outline="", **rect_style)
+            text = canvas.create_text(
+                (start[0] + start[2]) / 2, (start[1] + start[3]) / 2, **text_style
+            )
+            sprites.append((rect, text, start, end))
+        
+        self.animation = sprites
+        self.animation_merges = merge_positions
+        self.animation_start = time.perf_counter()
+        self.animation_after_id = self.root.after(self.frame_interval, self.animation_frame)
+    
+    def animation_frame(self):
+        """Draw one animation frame positioned by the time actually elapsed"""
+        self.animation_after_id = None
+        frame_start = time.perf_counter()
+        progress = (frame_start - self.animation_start) / self.animation_duration
+        if progress >= 1:
+            self.finish_animation()
+            return
+        
+        canvas = self.board_canvas
+        for rect, text, start, end in self.animation:
+            x0 = start[0] + (end[0] - start[0]) * progress
+            y0 = start[1] + (end[1] - start[1]) * progress
+            canvas.coords(rect, x0, y0, x0 + self.cell_size, y0 + self.cell_size)
+            canvas.coords(text, x0 + self.cell_size / 2, y0 + self.cell_size / 2)
+        
+        # Late frames simply jump ahead; a frame over budget skips the next one
+        delay = self.frame_interval
+        if (time.perf_counter() - frame_start) * 1000 > self.frame_budget:
+            delay *= 2
+        self.animation_after_id = self.root.after(delay, self.animation_frame)
+    
+    def cancel_animation(self):
+        """Remove a running animation without drawing the final board"""
+        if self.animation is None:
+            return
+        
+        if self.animation_after_id is not None:
+            self.root.after_cancel(self.animation_after_id)
+            self.animation_after_id = None
+        for rect, text, start, end in self.animation:
+            self.board_canvas.delete(rect, text)
+        self.animation = None
+    
+    def finish_animation(self):
+        """Jump a running animation to its end and show the final board"""
+        if self.animation is None:
+            return
+        
+        self.cancel_animation()
+        self.update_ui()
+        self.flash_merges(self.animation_merges)
+    
+    def tile_style(self, value):
+        """Return the cached (rectangle, text) canvas options for a tile value"""
+        style = self.tile_styles.get(value)
+        if style is None:
+            style = (
+                {"fill": self.tile_colors.get(value, self.empty_color)},
+                {
+                    "text": str(value) if value else "",
+                    "fill": self.text_colors.get(value, self.text_color),
+                    "font": ("Arial", self.calculate_font_size(value), "bold")
+                }
+            )
+            self.tile_styles[value] = style
+        return style
+    
     def calculate_font_size(self, value):
         """Calculate appropriate font size based on tile value"""
         if value == 0:
@@ -475,190 +1124,132 @@ class Game2048Tkinter:
     
     def move(self, direction):
         """Handle a move in the specified direction"""
+        merge_positions = self.apply_move(direction)
+        if merge_positions is not None:
+            self.finish_moves(merge_positions)
+    
+    def apply_move(self, direction):
+        """Run a move's game logic without redrawing
+        
+        Returns the merged positions, or None if nothing moved.
+        """
+        # A keypress preempts any search still running for the old board
+        self.cancel_computation()
+        self.finish_animation()
+        
         if not self.game_active:
-            return
+            return None
             
-        moved = False
         merge_positions = set()
+        board = self.engine.board
+        moved = self.engine.move(direction, merge_positions)
+        if not moved:
+            return None
+        self.last_paths = tile_paths(board, direction) if self.animations_enabled else None
         
-        # Process the move based on direction
-        if direction == 0: 
-            moved = self.process_move_up(merge_positions)
-        elif direction == 1: 
-            moved = self.process_move_right(merge_positions)
-        elif direction == 2:  
-            moved = self.process_move_down(merge_positions)
-        elif direction == 3: 
-            moved = self.process_move_left(merge_positions)
-        
-        if moved:
-            self.moves_count += 1
-            self.play_sound("move")
-            
-            if self.tutorial_mode:
-                self.handle_tutorial_progress(direction)
-            else:
-                self.add_random_tile()
-                
-            if self.score > self.high_score:
-                self.high_score = self.score
-                self.save_high_score()
+        # Flashed cells are dirty, so the next redraw restores them
+        self.cancel_merge_flash()
+        self.clear_hint()
+        if merge_positions:
+            board = self.engine.board
+            level = max(get_exponent(board, i, j) for i, j in merge_positions)
+            self.queue_sound("merge", level)
+        else:
+            self.queue_sound("move")
+        
+        if self.tutorial_mode:
+            self.handle_tutorial_progress(direction)
+        else:
+            self.add_random_tile()
+        self.journal.update(self.engine.history)
             
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.save_high_score()
+        return merge_positions
+    
+    def finish_moves(self, merge_positions):
+        """Redraw after one or more moves and check for the end of the game"""
+        self.flush_sounds()
+        if self.last_paths is not None:
+            # The board and merge highlights are drawn once the slide ends
+            self.update_labels()
+            self.start_animation(self.last_paths, merge_positions)
+        else:
             self.update_ui()
-            
-            # Highlight merged tiles briefly
-            for i, j in merge_positions:
-                self.cells[i][j].config(bg="#FFD700")
-                self.root.after(100, lambda i=i, j=j: self.update_ui())
-            
-            if not self.tutorial_mode:
-                if self.is_game_over():
-                    self.game_over()
-                elif self.has_won():
-                    self.player_wins()
+            self.flash_merges(merge_positions)
+        
+        if not self.tutorial_mode:
+            if self.is_game_over():
+                self.input_queue.clear()
+                self.finish_animation()
+                self.game_over()
+            elif self.has_won():
+                self.finish_animation()
+                self.player_wins()
+    
+    def queue_move(self, direction):
+        """Queue a move from the keyboard, dropping it when the queue is full"""
+        self.cancel_computation()
+        if len(self.input_queue) >= self.max_queued_moves:
+            return
+        
+        self.input_queue.append(direction)
+        if self.input_after_id is None:
+            self.process_input_queue()
+    
+    def process_input_queue(self):
+        """Apply up to moves_per_frame queued moves with a single redraw"""
+        self.input_after_id = None
+        if not self.input_queue:
+            return
+        
+        last_merges = None
+        for _ in range(self.moves_per_frame):
+            if not self.input_queue:
+                break
+            merge_positions = self.apply_move(self.input_queue.popleft())
+            if merge_positions is not None:
+                last_merges = merge_positions
+        
+        if last_merges is not None:
+            self.finish_moves(last_merges)
+        
+        # Keep ticking so that keys arriving meanwhile wait for the next frame
+        self.input_after_id = self.root.after(self.input_interval, self.process_input_queue)
     
     def handle_tutorial_progress(self, direction):
         """Handle tutorial progress after a move"""
         if self.tutorial_step == 1 and direction == 1: 
             self.tutorial_step += 1
-            self.play_sound("tutorial")
+            self.queue_sound("tutorial")
             self.update_tutorial_instruction()
         elif self.tutorial_step == 3 and direction == 0: 
             self.tutorial_step += 1
-            self.play_sound("tutorial")
+            self.queue_sound("tutorial")
             self.update_tutorial_instruction()
         elif self.tutorial_step >= 5:  
             self.tutorial_mode = False
             self.tutorial_label.pack_forget()
             self.add_random_tile()
     
-    def process_move_up(self, merge_positions):
-        """Process upward move and return if any tiles moved"""
-        moved = False
-        for j in range(self.grid_size):
-            column = [self.grid[i][j] for i in range(self.grid_size) if self.grid[i][j] != 0]
-            merged = []
-            i = 0
-            while i < len(column):
-                if i + 1 < len(column) and column[i] == column[i + 1]:
-                    merged_value = column[i] * 2
-                    merged.append(merged_value)
-                    merge_positions.add((len(merged)-1, j))
-                    self.score += merged_value
-                    i += 2
-                    self.play_sound("merge")
-                else:
-                    merged.append(column[i])
-                    i += 1
-            merged += [0] * (self.grid_size - len(merged))
-            for i in range(self.grid_size):
-                if self.grid[i][j] != merged[i]:
-                    moved = True
-                self.grid[i][j] = merged[i]
-        return moved
-    
-    def process_move_right(self, merge_positions):
-        """Process right move and return if any tiles moved"""
-        moved = False
-        for i in range(self.grid_size):
-            row = [self.grid[i][j] for j in range(self.grid_size-1, -1, -1) if self.grid[i][j] != 0]
-            merged = []
-            j = 0
-            while j < len(row):
-                if j + 1 < len(row) and row[j] == row[j + 1]:
-                    merged_value = row[j] * 2
-                    merged.append(merged_value)
-                    merge_positions.add((i, self.grid_size-1-(len(merged)-1)))
-                    self.score += merged_value
-                    j += 2
-                    self.play_sound("merge")
-                else:
-                    merged.append(row[j])
-                    j += 1
-            merged += [0] * (self.grid_size - len(merged))
-            for j in range(self.grid_size):
-                if self.grid[i][self.grid_size-1-j] != merged[j]:
-                    moved = True
-                self.grid[i][self.grid_size-1-j] = merged[j]
-        return moved
-    
-    def process_move_down(self, merge_positions):
-        """Process downward move and return if any tiles moved"""
-        moved = False
-        for j in range(self.grid_size):
-            column = [self.grid[i][j] for i in range(self.grid_size-1, -1, -1) if self.grid[i][j] != 0]
-            merged = []
-            i = 0
-            while i < len(column):
-                if i + 1 < len(column) and column[i] == column[i + 1]:
-                    merged_value = column[i] * 2
-                    merged.append(merged_value)
-                    merge_positions.add((self.grid_size-1-(len(merged)-1), j))
-                    self.score += merged_value
-                    i += 2
-                    self.play_sound("merge")
-                else:
-                    merged.append(column[i])
-                    i += 1
-            merged += [0] * (self.grid_size - len(merged))
-            for i in range(self.grid_size):
-                if self.grid[self.grid_size-1-i][j] != merged[i]:
-                    moved = True
-                self.grid[self.grid_size-1-i][j] = merged[i]
-        return moved
-    
-    def process_move_left(self, merge_positions):
-        """Process left move and return if any tiles moved"""
-        moved = False
-        for i in range(self.grid_size):
-            row = [self.grid[i][j] for j in range(self.grid_size) if self.grid[i][j] != 0]
-            merged = []
-            j = 0
-            while j < len(row):
-                if j + 1 < len(row) and row[j] == row[j + 1]:
-                    merged_value = row[j] * 2
-                    merged.append(merged_value)
-                    merge_positions.add((i, len(merged)-1))
-                    self.score += merged_value
-                    j += 2
-                    self.play_sound("merge")
-                else:
-                    merged.append(row[j])
-                    j += 1
-            merged += [0] * (self.grid_size - len(merged))
-            for j in range(self.grid_size):
-                if self.grid[i][j] != merged[j]:
-                    moved = True
-                self.grid[i][j] = merged[j]
-        return moved
-    
     def has_won(self):
         """Check if the player has reached the 2048 tile"""
-        return any(2048 in row for row in self.grid)
+        return self.engine.has_won()
     
     def is_game_over(self):
         """Check if the game is over (no more valid moves)"""
         if self.tutorial_mode:
             return False
             
-        # Check if there are empty cells
-        if any(0 in row for row in self.grid):
-            return False
-        
-        # Check for possible merges
-        for i in range(self.grid_size):
-            for j in range(self.grid_size):
-                if j + 1 < self.grid_size and self.grid[i][j] == self.grid[i][j + 1]:
-                    return False
-                if i + 1 < self.grid_size and self.grid[i][j] == self.grid[i + 1][j]:
-                    return False
-        
-        return True
+        return self.engine.is_game_over()
     
     def game_over(self):
         """Handle game over condition"""
-        self.game_active = False
+        # Played first, since sounds are muted once the game is inactive
         self.play_sound("game_over")
+        self.game_active = False
+        self.journal.end()
         elapsed_time = time.time() - self.start_time
         time_str = time.strftime("%H:%M:%S", time.gmtime(elapsed_time))
         
@@ -693,6 +1284,18 @@ class Game2048Tkinter:
         """Reset the game to initial state"""
         self.initialize_game()
     
+    def new_seeded_game(self):
+        """Start a new game whose tiles spawn from a player-chosen seed"""
+        seed = simpledialog.askinteger(
+            "New Seeded Game",
+            "Enter a seed. Games with the same seed and moves are identical:",
+            parent=self.root,
+            minvalue=0,
+            maxvalue=2**64 - 1
+        )
+        if seed is not None:
+            self.initialize_game(seed)
+    
     def show_statistics(self):
         """Show game statistics"""
         elapsed_time = time.time() - self.start_time
@@ -702,7 +1305,8 @@ class Game2048Tkinter:
             f"Current Game Statistics:\n\n"
             f"Score: {self.score}\n"
             f"Moves: {self.moves_count}\n"
-            f"Time Played: {time_str}\n\n"
+            f"Time Played: {time_str}\n"
+            f"Seed: {self.engine.seed}\n\n"
             f"High Score: {self.high_score}"
         )
         
@@ -718,9 +1322,16 @@ class Game2048Tkinter:
             "• Numpad (8=Up, 4=Left, 2=Down, 6=Right)\n\n"
             "Actions:\n"
             "• R - Restart game\n"
+            "• H - Show hint\n"
+            "• P - Start autoplay\n"
+            "• Esc - Cancel hint search or autoplay\n"
+            "• Space - Play or pause a replay\n"
             "• 0 - Exit game\n\n"
             "Menu Options:\n"
             "• Tutorial Mode\n"
+            "• Autoplay with a choice of agent\n"
+            "• New seeded game, reproducible from its seed\n"
+            "• Watch replays of journaled games\n"
             "• View statistics\n"
         )
         messagebox.showinfo("Game Controls", controls)
@@ -732,7 +1343,7 @@ class Game2048Tkinter:
             "A Python implementation of the popular 2048 puzzle game\n"
             "using Tkinter for the GUI.\n\n"
             "Features:\n"
-            "- Basic animations\n"
+            "- Sliding and merging animations\n"
             "- Sound effects\n"
             "- Game statistics\n"
             "- Tutorial mode\n"
@@ -743,6 +1354,10 @@ class Game2048Tkinter:
     def exit_game(self):
         """Exit the game after confirmation"""
         if messagebox.askokcancel("Exit Game", "Do you really want to exit the game?"):
+            self.cancel_computation()
+            self.worker.shutdown()
+            self.high_score_store.flush()
+            self.journal.close()
             self.root.destroy()
 
 if __name__ == "__main__":
@@ -0,0 +1,233 @@
+"""Move-choosing agents that work on packed boards.
+
+ExpectimaxAgent searches player moves (max nodes) and tile spawns (chance
+nodes, 2 with probability 0.7 and 4 with 0.3 as in add_random_tile). Leaf
+boards are scored with a per-row heuristic table and searched positions are
+cached in a bounded transposition table keyed on the packed board.
+"""
+import random
+from collections import OrderedDict
+
+from bitboard import empty_mask, transpose
+from move_tables import TABLE_SIZE, legal_moves, move_board
+
+# Heuristic weights from the well known nneonneo 2048 AI
+SCORE_LOST_PENALTY = 200000.0
+SCORE_MONOTONICITY_POWER = 4.0
+SCORE_MONOTONICITY_WEIGHT = 47.0
+SCORE_SUM_POWER = 3.5
+SCORE_SUM_WEIGHT = 11.0
+SCORE_MERGES_WEIGHT = 700.0
+SCORE_EMPTY_WEIGHT = 270.0
+
+# Chance nodes reached with a lower probability than this are scored directly
+CPROB_THRESHOLD = 0.0001
+
+_heuristic_table = None
+
+
+class _SearchStopped(Exception):
+    """Raised inside a search when its should_stop callback fires"""
+
+
+def _row_heuristic(row):
+    """Score a single 16-bit row, higher is better"""
+    tiles = [(row >> (4 * j)) & 0xF for j in range(4)]
+    total = 0.0
+    empty = 0
+    merges = 0
+    prev = 0
+    counter = 0
+    for rank in tiles:
+        total += rank ** SCORE_SUM_POWER
+        if rank == 0:
+            empty += 1
+        else:
+            if prev == rank:
+                counter += 1
+            elif counter > 0:
+                merges += 1 + counter
+                counter = 0
+            prev = rank
+    if counter > 0:
+        merges += 1 + counter
+
+    monotonicity_left = 0.0
+    monotonicity_right = 0.0
+    for j in range(1, 4):
+        if tiles[j - 1] > tiles[j]:
+            monotonicity_left += (tiles[j - 1] ** SCORE_MONOTONICITY_POWER
+                                  - tiles[j] ** SCORE_MONOTONICITY_POWER)
+        else:
+            monotonicity_right += (tiles[j] ** SCORE_MONOTONICITY_POWER
+                                   - tiles[j - 1] ** SCORE_MONOTONICITY_POWER)
+
+    return (SCORE_LOST_PENALTY + SCORE_EMPTY_WEIGHT * empty + SCORE_MERGES_WEIGHT * merges
+            - SCORE_MONOTONICITY_WEIGHT * min(monotonicity_left, monotonicity_right)
+            - SCORE_SUM_WEIGHT * total)
+
+
+def heuristic_table():
+    """Return the per-row heuristic table, building it on first use"""
+    global _heuristic_table
+    if _heuristic_table is None:
+        _heuristic_table = [_row_heuristic(row) for row in range(TABLE_SIZE)]
+    return _heuristic_table
+
+
+def evaluate(board):
+    """Heuristic value of a board, summed over its rows and columns"""
+    table = heuristic_table()
+    transposed = transpose(board)
+    return (table[board & 0xFFFF] + table[(board >> 16) & 0xFFFF]
+            + table[(board >> 32) & 0xFFFF] + table[board >> 48]
+            + table[transposed & 0xFFFF] + table[(transposed >> 16) & 0xFFFF]
+            + table[(transposed >> 32) & 0xFFFF] + table[transposed >> 48])
+
+
+class TranspositionTable:
+    """Bounded cache of searched positions with least-recently-used eviction"""
+
+    def __init__(self, max_size=100000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, board, depth):
+        """Return the cached value for board if it was searched at least this deep"""
+        entry = self.entries.get(board)
+        if entry is None or entry[0] < depth:
+            return None
+        self.entries.move_to_end(board)
+        return entry[1]
+
+    def put(self, board, depth, value):
+        """Cache the value of board searched to the given depth"""
+        self.entries[board] = (depth, value)
+        self.entries.move_to_end(board)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def play(engine, agent, should_stop=None, on_step=None):
+    """Let agent play engine until the game is over or should_stop returns True
+
+    on_step is called with the engine after every move. Returns the engine.
+    """
+    while should_stop is None or not should_stop():
+        direction = agent.choose_move(engine.board, should_stop)
+        if direction is None:
+            break
+        engine.step(direction)
+        if on_step is not None:
+            on_step(engine)
+    return engine
+
+
+class RandomAgent:
+    """Picks a uniformly random legal move"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose_move(self, board, should_stop=None):
+        """Return a random legal direction, or None if no move is legal"""
+        legal = legal_moves(board)
+        if not legal:
+            return None
+        return self.rng.choice([direction for direction in range(4) if legal >> direction & 1])
+
+
+class GreedyAgent:
+    """Picks the move whose resulting board scores best right away"""
+
+    def choose_move(self, board, should_stop=None):
+        """Return the best direction one move ahead, or None if no move is legal"""
+        best_direction = None
+        best_value = float("-inf")
+        for direction in range(4):
+            new_board, gained, _ = move_board(board, direction)
+            if new_board == board:
+                continue
+            value = gained + evaluate(new_board)
+            if value > best_value:
+                best_value = value
+                best_direction = direction
+        return best_direction
+
+
+class ExpectimaxAgent:
+    """Depth-limited expectimax search over packed boards"""
+
+    def __init__(self, depth=3, table_size=100000):
+        self.depth = depth
+        self.table = TranspositionTable(table_size)
+        self.should_stop = None
+
+    def choose_move(self, board, should_stop=None):
+        """Return the best direction for board, or None if no move is legal
+
+        should_stop is polled throughout the search; once it returns True the
+        best direction among the fully searched ones is returned, or None if
+        the search was stopped before any finished.
+        """
+        heuristic_table()
+        self.should_stop = should_stop
+        best_direction = None
+        best_value = float("-inf")
+        legal = legal_moves(board)
+        try:
+            for direction in range(4):
+                if not legal >> direction & 1:
+                    continue
+                new_board, gained, _ = move_board(board, direction)
+                value = gained + self._chance_node(new_board, self.depth - 1, 1.0)
+                if value > best_value:
+                    best_value = value
+                    best_direction = direction
+        except _SearchStopped:
+            pass
+        finally:
+            self.should_stop = None
+        return best_direction
+
+    def _chance_node(self, board, depth, cprob):
+        """Expected value over every possible spawn on board"""
+        if depth < 0 or cprob < CPROB_THRESHOLD:
+            return evaluate(board)
+
+        cached = self.table.get(board, depth)
+        if cached is not None:
+            return cached
+        if depth and self.should_stop is not None and self.should_stop():
+            raise _SearchStopped()
+
+        mask = empty_mask(board)
+        count = mask.bit_count()
+        cprob /= count
+        total = 0.0
+        while mask:
+            cell_bit = mask & -mask
+            mask ^= cell_bit
+            total += 0.7 * self._max_node(board | cell_bit, depth, cprob * 0.7)
+            total += 0.3 * self._max_node(board | (cell_bit << 1), depth, cprob * 0.3)
+        value = total / count
+
+        self.table.put(board, depth, value)
+        return value
+
+    def _max_node(self, board, depth, cprob):
+        """Value of the best move from board, or 0 if the game is lost"""
+        best = 0.0
+        for direction in range(4):
+            new_board, gained, _ = move_board(board, direction)
+            if new_board != board:
+                value = gained + self._chance_node(new_board, depth - 1, cprob)
+                if value > best:
+                    best = value
+        return best
@@ -0,0 +1,92 @@
+import os
+import threading
+
+import sound_synth
+
+SOUND_NAMES = ["move", "merge", "game_over", "win", "tutorial"]
+
+# Mixer channels reserved for the game, reused round-robin
+CHANNEL_COUNT = 4
+
+# Optional replacement sound files, looked up next to this module
+SOUNDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sounds")
+
+
+class SoundPlayer:
+    """Plays the game's sound effects
+
+    pygame is only imported, and its mixer only initialized, on a background
+    thread started by start() or by the first play() call. Until that has
+    finished, or if no audio device is available, play() does nothing.
+    Sounds play on a fixed pool of reserved channels, so a burst of events
+    replaces the oldest sound instead of piling up new voices.
+
+    Every effect is synthesized by sound_synth (or read from its disk cache)
+    once during initialization and kept in memory, so playing never touches
+    the disk. A sounds/<name>.wav file next to this module replaces the
+    built-in effect of that name.
+    """
+
+    def __init__(self, cache_dir=sound_synth.CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.ready = False
+        self.sounds = {}
+        self.channels = []
+        self.next_channel = 0
+        self.thread = None
+
+    def start(self):
+        """Begin initializing audio in the background"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._initialize, daemon=True)
+            self.thread.start()
+
+    def _initialize(self):
+        """Initialize the mixer and build every sound effect"""
+        try:
+            from pygame import mixer
+            mixer.init(frequency=sound_synth.SAMPLE_RATE, size=-16, channels=1)
+            mixer.set_num_channels(max(mixer.get_num_channels(), CHANNEL_COUNT))
+            mixer.set_reserved(CHANNEL_COUNT)
+            self.channels = [mixer.Channel(i) for i in range(CHANNEL_COUNT)]
+            rate, size, channels = mixer.get_init()
+
+            def build(name, level=0):
+                if size != -16:
+                    return None
+                pcm = sound_synth.load_pcm(name, level, rate, channels, self.cache_dir)
+                return mixer.Sound(buffer=pcm)
+
+            sounds = {}
+            for name in SOUND_NAMES:
+                path = os.path.join(SOUNDS_DIR, f"{name}.wav")
+                sounds[name] = mixer.Sound(path) if os.path.exists(path) else build(name)
+            if not os.path.exists(os.path.join(SOUNDS_DIR, "merge.wav")):
+                for level in sound_synth.MERGE_LEVELS:
+                    sounds[("merge", level)] = build("merge", level)
+            self.sounds = sounds
+            self.ready = True
+        except Exception:
+            pass
+
+    def play(self, name, level=0):
+        """Play a sound effect if audio is ready
+
+        level is the tile exponent behind the event, e.g. of the largest
+        merge; bigger merges play higher and louder. Level 0 plays at full
+        volume.
+        """
+        if not self.ready:
+            self.start()
+            return
+
+        sound = self.sounds.get((name, level)) or self.sounds.get(name)
+        if sound is None:
+            return
+        try:
+            channel = self.channels[self.next_channel]
+            self.next_channel = (self.next_channel + 1) % CHANNEL_COUNT
+            channel.set_volume(0.6 + 0.4 * min(level, 11) / 11 if level else 1.0)
+            channel.play(sound)
+        except Exception:
+            pass
@@ -0,0 +1,169 @@
+"""Vectorized 2048 engine that steps many packed boards per call.
+
+Boards use the layout from bitboard.py and are stored in one uint64 NumPy
+array, so a single call moves, scores and spawns on every board at once
+using the row tables from move_tables.py.
+"""
+import numpy as np
+
+from move_tables import ROW_CAN_MOVE, ROW_LEFT, ROW_RIGHT, ROW_SCORE
+from rng import FOUR_THRESHOLD, GOLDEN_GAMMA, STREAM_SALT, new_seed
+
+_ROW_LEFT = np.array(ROW_LEFT, dtype=np.uint64)
+_ROW_RIGHT = np.array(ROW_RIGHT, dtype=np.uint64)
+_ROW_SCORE = np.array(ROW_SCORE, dtype=np.int64)
+_ROW_CAN_MOVE = np.array(ROW_CAN_MOVE, dtype=np.uint8)
+_ROW_MASK = np.uint64(0xFFFF)
+_CELL_MASK = np.uint64(0xF)
+_ROW_SHIFTS = [np.uint64(16 * k) for k in range(4)]
+_CELL_SHIFTS = np.arange(0, 64, 4, dtype=np.uint64)
+_LOW32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+
+def transpose_boards(boards):
+    """Swap rows and columns of every packed board in an array"""
+    a1 = boards & np.uint64(0xF0F00F0FF0F00F0F)
+    a2 = boards & np.uint64(0x0000F0F00000F0F0)
+    a3 = boards & np.uint64(0x0F0F00000F0F0000)
+    a = a1 | (a2 << np.uint64(12)) | (a3 >> np.uint64(12))
+    b1 = a & np.uint64(0xFF00FF0000FF00FF)
+    b2 = a & np.uint64(0x00FF00FF00000000)
+    b3 = a & np.uint64(0x00000000FF00FF00)
+    return b1 | (b2 >> np.uint64(24)) | (b3 << np.uint64(24))
+
+
+def _mix64(z):
+    """rng.mix64 over a uint64 array (multiplications wrap modulo 2**64)"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _random64(seeds, counters):
+    """rng.random64 over arrays of seeds and counters"""
+    return _mix64(seeds + (counters + np.uint64(1)) * np.uint64(GOLDEN_GAMMA))
+
+
+def derive_seeds(root_seed, indices):
+    """rng.derive_seed for an array of stream indices"""
+    salted = np.full(len(indices), root_seed ^ STREAM_SALT, dtype=np.uint64)
+    return _random64(salted, np.asarray(indices, dtype=np.uint64))
+
+
+def _rows(boards):
+    """Split boards into their four 16-bit rows as table indices"""
+    return [((boards >> shift) & _ROW_MASK).astype(np.intp) for shift in _ROW_SHIFTS]
+
+
+def move_boards(boards, directions):
+    """Apply one move per board
+
+    Directions are 0=up, 1=right, 2=down, 3=left, as in Game2048Engine.move.
+    Returns (new_boards, score_deltas) without spawning any tiles.
+    """
+    directions = np.asarray(directions)
+    vertical = (directions & 1) == 0
+    use_left = (directions == 0) | (directions == 3)
+
+    oriented = np.where(vertical, transpose_boards(boards), boards)
+    result = np.zeros_like(boards)
+    deltas = np.zeros(boards.shape, dtype=np.int64)
+    for shift, row in zip(_ROW_SHIFTS, _rows(oriented)):
+        result |= np.where(use_left, _ROW_LEFT[row], _ROW_RIGHT[row]) << shift
+        deltas += _ROW_SCORE[row]
+    return np.where(vertical, transpose_boards(result), result), deltas
+
+
+def legal_moves_boards(boards):
+    """Return the 4-bit legal direction mask of every board, as legal_moves does"""
+    horizontal = np.zeros(boards.shape, dtype=np.uint8)
+    for row in _rows(boards):
+        horizontal |= _ROW_CAN_MOVE[row]
+    vertical = np.zeros(boards.shape, dtype=np.uint8)
+    for row in _rows(transpose_boards(boards)):
+        vertical |= _ROW_CAN_MOVE[row]
+    return (vertical & 1) | (horizontal & 2) | ((vertical & 2) << 1) | ((horizontal & 1) << 3)
+
+
+def game_over_boards(boards):
+    """Return a bool array marking boards with no legal move"""
+    return legal_moves_boards(boards) == 0
+
+
+class BatchGame2048Engine:
+    """N independent 2048 games advanced together
+
+    boards, scores and moves_count are NumPy arrays of length N. Spawning
+    follows Game2048Engine.add_random_tile: a uniformly chosen empty cell
+    gets a 4 with probability 0.3 and a 2 otherwise.
+
+    Every game started by reset() is numbered, and game g plays with seed
+    rng.derive_seed(root_seed, g), so it spawns exactly like a
+    Game2048Engine with that seed given the same moves.
+    """
+
+    def __init__(self, n_boards, seed=None):
+        self.n_boards = n_boards
+        self.root_seed = new_seed() if seed is None else seed
+        self.games_started = 0
+        self.seeds = np.zeros(n_boards, dtype=np.uint64)
+        self.spawn_counts = np.zeros(n_boards, dtype=np.uint64)
+        self.boards = np.zeros(n_boards, dtype=np.uint64)
+        self.scores = np.zeros(n_boards, dtype=np.int64)
+        self.moves_count = np.zeros(n_boards, dtype=np.int64)
+        self.reset()
+
+    def reset(self, mask=None):
+        """Start fresh games with two tiles, on every board or where mask is set"""
+        if mask is None:
+            mask = np.ones(self.n_boards, dtype=bool)
+        self.boards[mask] = 0
+        self.scores[mask] = 0
+        self.moves_count[mask] = 0
+        started = np.flatnonzero(mask)
+        self.seeds[started] = derive_seeds(self.root_seed, self.games_started + np.arange(len(started)))
+        self.spawn_counts[started] = 0
+        self.games_started += len(started)
+        self.add_random_tiles(mask)
+        self.add_random_tiles(mask)
+
+    def add_random_tiles(self, mask=None):
+        """Add a random tile to an empty cell of every board, or where mask is set"""
+        cells = (self.boards[:, None] >> _CELL_SHIFTS) & _CELL_MASK
+        empty = cells == 0
+        counts = empty.sum(axis=1)
+        targets = counts > 0
+        if mask is not None:
+            targets &= mask
+
+        # Pick the k-th empty cell of each board, as rng.spawn_choice does
+        value = _random64(self.seeds, self.spawn_counts)
+        k = (((value >> _SHIFT32) * counts.astype(np.uint64)) >> _SHIFT32).astype(np.int64)
+        position = np.argmax(np.cumsum(empty, axis=1) > k[:, None], axis=1)
+        exponent = np.where((value & _LOW32) < FOUR_THRESHOLD, 2, 1).astype(np.uint64)
+        spawned = exponent << (position.astype(np.uint64) * np.uint64(4))
+        self.boards |= np.where(targets, spawned, np.uint64(0))
+        self.spawn_counts += targets.astype(np.uint64)
+
+    def move(self, directions):
+        """Slide every board in its direction without spawning
+
+        Returns (score_deltas, moved) arrays.
+        """
+        new_boards, deltas = move_boards(self.boards, directions)
+        moved = new_boards != self.boards
+        deltas = np.where(moved, deltas, 0)
+        self.boards = new_boards
+        self.scores += deltas
+        self.moves_count += moved
+        return deltas, moved
+
+    def step(self, directions):
+        """Move every board, spawn on those that moved and check for game over
+
+        Returns (score_deltas, moved, game_over) arrays.
+        """
+        deltas, moved = self.move(directions)
+        self.add_random_tiles(moved)
+        return deltas, moved, game_over_boards(self.boards)
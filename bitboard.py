@@ -0,0 +1,89 @@
+"""Packed 64-bit representation of a 4x4 2048 board.
+
+A board is a plain int. Cell (i, j) stores the exponent of its tile in the
+4 bits starting at 16*i + 4*j, with 0 meaning empty, so 2 is stored as 1 and
+32768 as 15. Row i therefore occupies the 16 bits starting at 16*i with its
+leftmost cell in the lowest nibble.
+"""
+
+GRID_SIZE = 4
+ROW_MASK = 0xFFFF
+CELL_MASK = 0xF
+MAX_EXPONENT = 15
+LOW_BITS = 0x1111111111111111
+
+
+def encode_tile(value):
+    """Return the 4-bit exponent stored for a tile value"""
+    if value == 0:
+        return 0
+    exponent = value.bit_length() - 1
+    if value < 2 or value != 1 << exponent or exponent > MAX_EXPONENT:
+        raise ValueError(f"Tile value {value} cannot be packed")
+    return exponent
+
+
+def decode_tile(exponent):
+    """Return the tile value for a 4-bit exponent"""
+    return 1 << exponent if exponent else 0
+
+
+def to_bitboard(grid):
+    """Pack a 4x4 list-of-lists grid into a 64-bit int"""
+    if len(grid) != GRID_SIZE or any(len(row) != GRID_SIZE for row in grid):
+        raise ValueError("Only 4x4 grids can be packed")
+    board = 0
+    shift = 0
+    for row in grid:
+        for value in row:
+            board |= encode_tile(value) << shift
+            shift += 4
+    return board
+
+
+def to_grid(board):
+    """Unpack a 64-bit board into a 4x4 list-of-lists grid"""
+    return [[decode_tile(get_exponent(board, i, j)) for j in range(GRID_SIZE)]
+            for i in range(GRID_SIZE)]
+
+
+def get_exponent(board, i, j):
+    """Return the exponent stored at (i, j), 0 for an empty cell"""
+    return (board >> (16 * i + 4 * j)) & CELL_MASK
+
+
+def empty_mask(board):
+    """Return a mask with the lowest bit of every empty cell's nibble set
+
+    Cell (i, j) is empty when bit 16*i + 4*j of the mask is set, so the
+    number of empty cells is the mask's bit count.
+    """
+    x = board | (board >> 2)
+    x |= x >> 1
+    return ~x & LOW_BITS
+
+
+def has_tile(board, value):
+    """Check if any cell holds the given tile value"""
+    return empty_mask(board ^ (encode_tile(value) * LOW_BITS)) != 0
+
+
+def max_tile(board):
+    """Return the largest tile value on the board"""
+    exponent = 0
+    while board:
+        exponent = max(exponent, board & CELL_MASK)
+        board >>= 4
+    return decode_tile(exponent)
+
+
+def transpose(board):
+    """Swap rows and columns of a packed board"""
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
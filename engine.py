@@ -0,0 +1,157 @@
+from bitboard import GRID_SIZE, empty_mask, has_tile, to_bitboard, to_grid
+from move_tables import legal_moves, move_board
+from rng import new_seed, spawn_choice
+
+# history records: a move is its direction byte (0-3), a spawn is
+# SPAWN_RECORD | (exponent - 1) << 4 | cell with cell = 4 * row + column
+SPAWN_RECORD = 0x80
+SPAWN_RECORDS = bytes(range(SPAWN_RECORD, SPAWN_RECORD + 0x20))
+
+
+class Game2048Engine:
+    """Headless 2048 game rules, usable without tkinter or pygame
+
+    The board is kept packed in a 64-bit int (see bitboard.py) and moves go
+    through the precomputed row tables in move_tables.py. empty_mask and
+    empty_count track the empty cells and are refreshed by every move and
+    spawn, so neither spawning nor game-over checks rescan the board.
+
+    history holds one record byte per move and spawn since reset(), enough
+    to replay the game from its starting board.
+
+    Spawns come from the game's own seeded stream (see rng.py): the n-th
+    tile placed since reset() is drawn from (seed, n), so a game is
+    reproduced by its seed and moves alone.
+    """
+
+    def __init__(self, seed=None):
+        self.grid_size = GRID_SIZE
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Clear the board, score, move counter and history
+
+        Spawns restart from seed, or from a fresh random seed if none is given.
+        """
+        self.board = 0
+        self.score = 0
+        self.moves_count = 0
+        self.history = bytearray()
+        self.seed = new_seed() if seed is None else seed
+        self.spawn_count = 0
+
+    def copy(self):
+        """Return an independent copy of this engine"""
+        clone = Game2048Engine(self.seed)
+        clone.spawn_count = self.spawn_count
+        clone._board = self._board
+        clone.empty_mask = self.empty_mask
+        clone.empty_count = self.empty_count
+        clone.score = self.score
+        clone.moves_count = self.moves_count
+        clone.history = self.history[:]
+        return clone
+
+    @property
+    def board(self):
+        """The board packed into a 64-bit int"""
+        return self._board
+
+    @board.setter
+    def board(self, value):
+        self._board = value
+        self.empty_mask = empty_mask(value)
+        self.empty_count = self.empty_mask.bit_count()
+
+    @property
+    def move_log(self):
+        """The directions of the moves in history, one byte per move"""
+        return self.history.translate(None, SPAWN_RECORDS)
+
+    @property
+    def grid(self):
+        """The board as a list-of-lists grid
+
+        This is a fresh copy, so assign a whole grid to change the board.
+        """
+        return to_grid(self.board)
+
+    @grid.setter
+    def grid(self, value):
+        self.board = to_bitboard(value)
+
+    def add_random_tile(self):
+        """Add a random tile (2 or 4) to an empty cell"""
+        if not self.empty_count:
+            return
+
+        k, exponent = spawn_choice(self.seed, self.spawn_count, self.empty_count)
+
+        # Walk to the chosen empty cell by clearing lower empty bits
+        mask = self.empty_mask
+        for _ in range(k):
+            mask &= mask - 1
+        cell = (mask & -mask).bit_length() // 4
+        self.place_tile(cell, exponent)
+
+    def place_tile(self, cell, exponent):
+        """Put a 2**exponent tile on the empty cell 4 * row + column"""
+        cell_bit = 1 << (4 * cell)
+        self._board |= cell_bit * exponent
+        self.empty_mask ^= cell_bit
+        self.empty_count -= 1
+        self.spawn_count += 1
+        self.history.append(SPAWN_RECORD | (exponent - 1) << 4 | cell)
+
+    def move(self, direction, merge_positions=None):
+        """Slide the board in the given direction and return if any tiles moved
+
+        Directions are 0=up, 1=right, 2=down, 3=left. Merged cells are added
+        to merge_positions when a set is given. No tile is spawned.
+        """
+        new_board, gained, merges = move_board(self._board, direction)
+        if new_board == self._board:
+            return False
+
+        self._board = new_board
+        self.empty_mask = empty_mask(new_board)
+        self.empty_count = self.empty_mask.bit_count()
+        self.score += gained
+        self.moves_count += 1
+        self.history.append(direction)
+        if merge_positions is not None:
+            while merges:
+                cell = (merges & -merges).bit_length() - 1
+                merge_positions.add(divmod(cell, GRID_SIZE))
+                merges &= merges - 1
+        return True
+
+    def step(self, direction):
+        """Move and spawn a new tile if the board changed"""
+        moved = self.move(direction)
+        if moved:
+            self.add_random_tile()
+        return moved
+
+    def replay(self, records):
+        """Apply history records, e.g. from another engine or a journal"""
+        for record in records:
+            if record & SPAWN_RECORD:
+                self.place_tile(record & 0xF, (record >> 4 & 1) + 1)
+            else:
+                self.move(record)
+
+    def has_won(self):
+        """Check if the board holds the 2048 tile"""
+        return has_tile(self._board, 2048)
+
+    def is_game_over(self):
+        """Check if the game is over (no more valid moves)"""
+        if self.empty_count:
+            return False
+
+        return not legal_moves(self._board)
+
+    def legal_moves(self):
+        """Return a 4-bit mask with bit d set when direction d is a legal move"""
+        return legal_moves(self._board)
@@ -0,0 +1,195 @@
+import atexit
+import os
+import struct
+import threading
+import time
+
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal")
+JOURNAL_MAGIC = b"2048JNL\x02"
+# magic, starting board, score, moves_count, start_time, seed, spawn_count
+JOURNAL_HEADER = struct.Struct("<8sQQIdQI")
+# Appended when the game is over or abandoned for another one
+END_RECORD = 0xFF
+
+
+def journal_paths(directory=JOURNAL_DIR):
+    """Return the journal files in directory, oldest first"""
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(".jnl")]
+    except FileNotFoundError:
+        return []
+    # Names are start times in milliseconds, so they sort numerically
+    names.sort(key=lambda name: (len(name), name))
+    return [os.path.join(directory, name) for name in names]
+
+
+def read_journal(path):
+    """Return (start state, records) of a journal file
+
+    The start state dict holds board, score, moves_count, start_time, seed
+    and spawn_count; records are engine history bytes (see engine.py) without the end marker.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < JOURNAL_HEADER.size:
+        raise ValueError("Truncated journal")
+    magic, board, score, moves_count, start_time, seed, spawn_count = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError("Not a journal file")
+    records = data[JOURNAL_HEADER.size:]
+    if records.endswith(bytes([END_RECORD])):
+        records = records[:-1]
+    state = {
+        "board": board,
+        "score": score,
+        "moves_count": moves_count,
+        "start_time": start_time,
+        "seed": seed,
+        "spawn_count": spawn_count,
+    }
+    return state, records
+
+
+def latest_unfinished(directory=JOURNAL_DIR):
+    """Return the path of the newest journal if its game was never finished"""
+    paths = journal_paths(directory)
+    if not paths:
+        return None
+    try:
+        with open(paths[-1], "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1)[0] != END_RECORD:
+                return paths[-1]
+    except (OSError, IndexError):
+        pass
+    return None
+
+
+class GameJournal:
+    """Append-only journal of the game in progress
+
+    Each game gets its own file, starting with the position it began from
+    and followed by the engine's history records: every move direction and
+    every spawned tile. update() only copies new records into a memory
+    buffer; a background timer appends the buffer to the file and fsyncs it
+    every fsync_interval seconds, so moves never wait for the disk. A crash
+    loses at most the last interval. Only the newest max_journals files are
+    kept; older ones are removed whenever a game ends.
+    """
+
+    def __init__(self, directory=JOURNAL_DIR, fsync_interval=1.0, max_journals=100):
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.max_journals = max_journals
+        # lock guards the buffer and is never held during disk I/O;
+        # write_lock keeps flushes and closing the file in order
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.buffer = bytearray()
+        self.file = None
+        self.path = None
+        self.recorded = 0
+        self.moved = False
+        self.timer = None
+        atexit.register(self.flush)
+
+    def start(self, engine, start_time):
+        """Begin the journal of a new game at the engine's current position"""
+        self.end()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{int(time.time() * 1000)}.jnl")
+            f = open(path, "xb")
+        except OSError:
+            return
+        with self.lock:
+            self.file = f
+            self.path = path
+            self.buffer += JOURNAL_HEADER.pack(
+                JOURNAL_MAGIC, engine.board, engine.score, engine.moves_count, start_time,
+                engine.seed, engine.spawn_count
+            )
+        self.recorded = len(engine.history)
+        self.moved = False
+
+    def resume(self, path, engine):
+        """Continue an unfinished journal whose records engine has replayed"""
+        self.end()
+        try:
+            f = open(path, "ab")
+        except OSError:
+            return
+        with self.lock:
+            self.file = f
+            self.path = path
+        self.recorded = len(engine.history)
+        self.moved = True
+
+    def update(self, history):
+        """Queue the records added to an engine history since the last call"""
+        if self.file is None or len(history) <= self.recorded:
+            return
+        records = history[self.recorded:]
+        self.recorded = len(history)
+        self.moved = self.moved or any(record < 4 for record in records)
+        with self.lock:
+            self.buffer += records
+            if self.timer is None:
+                self.timer = threading.Timer(self.fsync_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Write and fsync the buffered records now"""
+        with self.write_lock:
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                data, self.buffer = self.buffer, bytearray()
+                f = self.file
+            if f is None or not data:
+                return
+            try:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            except (OSError, ValueError):
+                pass
+
+    def close(self):
+        """Flush and close the journal, leaving the game resumable"""
+        self.flush()
+        with self.write_lock:
+            with self.lock:
+                f = self.file
+                self.file = None
+                self.path = None
+            if f is not None:
+                f.close()
+
+    def end(self):
+        """Mark the game finished; journals of games without a move are removed"""
+        if self.file is None:
+            return
+        path, moved = self.path, self.moved
+        with self.lock:
+            self.buffer.append(END_RECORD)
+        self.close()
+        if not moved:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.prune()
+
+    def prune(self):
+        """Remove the oldest journals beyond max_journals"""
+        paths = journal_paths(self.directory)
+        for path in paths[:max(0, len(paths) - self.max_journals)]:
+            if path == self.path:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                pass
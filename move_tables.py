@@ -0,0 +1,214 @@
+"""Precomputed row transition tables for packed boards.
+
+Every 16-bit row (see bitboard.py) is mapped to the row it becomes after a
+left or right move, the score gained and the cells that received a merge.
+Column moves transpose the board and reuse the row tables, so a whole move is
+four table lookups. The tables are built once per process, or read back from
+a cache file written by an earlier run.
+"""
+import array
+import os
+
+from bitboard import MAX_EXPONENT, ROW_MASK, get_exponent, transpose
+
+TABLE_SIZE = 1 << 16
+CACHE_MAGIC = b"2048TBL\x01"
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "move_tables.bin")
+
+# Spreads a 4-bit row mask onto bits 0, 4, 8 and 12 so that column merge
+# masks can be shifted back into cell order after a transpose.
+_COLUMN_SPREAD = [sum(1 << (4 * k) for k in range(4) if m >> k & 1) for m in range(16)]
+
+# Mirrors a 4-bit row mask left to right.
+_REVERSE_MASK = [sum(1 << (3 - k) for k in range(4) if m >> k & 1) for m in range(16)]
+
+
+def _reverse_row(row):
+    """Mirror a 16-bit row left to right"""
+    return ((row & 0xF) << 12) | ((row & 0xF0) << 4) | ((row >> 4) & 0xF0) | (row >> 12)
+
+
+def _slide_row_left(row):
+    """Return (result, score, merge_mask) for sliding a 16-bit row left"""
+    tiles = [(row >> (4 * j)) & 0xF for j in range(4)]
+    tiles = [t for t in tiles if t]
+    merged = []
+    score = 0
+    merge_mask = 0
+    j = 0
+    while j < len(tiles):
+        # 32768 is the largest tile a nibble can hold, so a pair of them stays put
+        if j + 1 < len(tiles) and tiles[j] == tiles[j + 1] and tiles[j] < MAX_EXPONENT:
+            merge_mask |= 1 << len(merged)
+            merged.append(tiles[j] + 1)
+            score += 1 << (tiles[j] + 1)
+            j += 2
+        else:
+            merged.append(tiles[j])
+            j += 1
+    result = 0
+    for j, t in enumerate(merged):
+        result |= t << (4 * j)
+    return result, score, merge_mask
+
+
+def build_tables():
+    """Compute the row tables from scratch
+
+    Returns (left, right, score, left_merges, right_merges) as lists indexed
+    by row. The score table is shared by both directions because a row
+    always merges the same pairs of values whichever way it slides.
+    """
+    left = [0] * TABLE_SIZE
+    right = [0] * TABLE_SIZE
+    score = [0] * TABLE_SIZE
+    left_merges = [0] * TABLE_SIZE
+    right_merges = [0] * TABLE_SIZE
+    for row in range(TABLE_SIZE):
+        result, gained, merges = _slide_row_left(row)
+        left[row] = result
+        score[row] = gained
+        left_merges[row] = merges
+        mirrored = _reverse_row(row)
+        right[mirrored] = _reverse_row(result)
+        right_merges[mirrored] = _REVERSE_MASK[merges]
+    return left, right, score, left_merges, right_merges
+
+
+def _read_cache(path):
+    """Load tables from a cache file, or return None if it is missing or stale"""
+    try:
+        with open(path, "rb") as f:
+            if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            rows = array.array("H")
+            rows.fromfile(f, 2 * TABLE_SIZE)
+            scores = array.array("I")
+            scores.fromfile(f, TABLE_SIZE)
+            merges = array.array("B")
+            merges.fromfile(f, TABLE_SIZE)
+            if f.read(1):
+                return None
+    except (OSError, EOFError):
+        return None
+    merges = merges.tolist()
+    return (rows[:TABLE_SIZE].tolist(), rows[TABLE_SIZE:].tolist(), scores.tolist(),
+            [m & 0xF for m in merges], [m >> 4 for m in merges])
+
+
+def _write_cache(path, tables):
+    """Write tables to a cache file, ignoring failures"""
+    left, right, score, left_merges, right_merges = tables
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_MAGIC)
+            array.array("H", left + right).tofile(f)
+            array.array("I", score).tofile(f)
+            array.array("B", [l | (r << 4) for l, r in zip(left_merges, right_merges)]).tofile(f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def load_tables(path=CACHE_PATH):
+    """Return the row tables, building and caching them if needed"""
+    tables = _read_cache(path) if path else None
+    if tables is None:
+        tables = build_tables()
+        if path:
+            _write_cache(path, tables)
+    return tables
+
+
+ROW_LEFT, ROW_RIGHT, ROW_SCORE, ROW_LEFT_MERGES, ROW_RIGHT_MERGES = load_tables()
+
+# Bit 0 is set when a left slide changes the row, bit 1 for a right slide
+ROW_CAN_MOVE = [(ROW_LEFT[row] != row) | ((ROW_RIGHT[row] != row) << 1) for row in range(TABLE_SIZE)]
+
+
+def move_board(board, direction):
+    """Apply a move to a packed board
+
+    Directions are 0=up, 1=right, 2=down, 3=left. Returns
+    (new_board, score_gained, merge_mask) where bit 4*i + j of merge_mask is
+    set when cell (i, j) holds a freshly merged tile.
+    """
+    if direction == 3:
+        rows, merge_table = ROW_LEFT, ROW_LEFT_MERGES
+    elif direction == 1:
+        rows, merge_table = ROW_RIGHT, ROW_RIGHT_MERGES
+    elif direction == 0:
+        rows, merge_table = ROW_LEFT, ROW_LEFT_MERGES
+        board = transpose(board)
+    elif direction == 2:
+        rows, merge_table = ROW_RIGHT, ROW_RIGHT_MERGES
+        board = transpose(board)
+    else:
+        return board, 0, 0
+
+    r0 = board & ROW_MASK
+    r1 = (board >> 16) & ROW_MASK
+    r2 = (board >> 32) & ROW_MASK
+    r3 = board >> 48
+    result = rows[r0] | (rows[r1] << 16) | (rows[r2] << 32) | (rows[r3] << 48)
+    score = ROW_SCORE[r0] + ROW_SCORE[r1] + ROW_SCORE[r2] + ROW_SCORE[r3]
+
+    if direction & 1:
+        merges = (merge_table[r0] | (merge_table[r1] << 4)
+                  | (merge_table[r2] << 8) | (merge_table[r3] << 12))
+        return result, score, merges
+
+    merges = (_COLUMN_SPREAD[merge_table[r0]] | (_COLUMN_SPREAD[merge_table[r1]] << 1)
+              | (_COLUMN_SPREAD[merge_table[r2]] << 2) | (_COLUMN_SPREAD[merge_table[r3]] << 3))
+    return transpose(result), score, merges
+
+
+def legal_moves(board):
+    """Return a 4-bit mask with bit d set when direction d changes the board
+
+    An empty mask means the game is over.
+    """
+    horizontal = (ROW_CAN_MOVE[board & ROW_MASK] | ROW_CAN_MOVE[(board >> 16) & ROW_MASK]
+                  | ROW_CAN_MOVE[(board >> 32) & ROW_MASK] | ROW_CAN_MOVE[board >> 48])
+    board = transpose(board)
+    vertical = (ROW_CAN_MOVE[board & ROW_MASK] | ROW_CAN_MOVE[(board >> 16) & ROW_MASK]
+                | ROW_CAN_MOVE[(board >> 32) & ROW_MASK] | ROW_CAN_MOVE[board >> 48])
+    # Left/up slides map to directions 3/0 and right/down to 1/2
+    return (vertical & 1) | (horizontal & 2) | ((vertical & 2) << 1) | ((horizontal & 1) << 3)
+
+
+def tile_paths(board, direction):
+    """List where every tile of board ends up after a move
+
+    Returns ((i, j), (dest_i, dest_j), value) for each tile, which is what
+    the GUI needs to animate a slide. Tiles that merge share a destination.
+    """
+    paths = []
+    for line in range(4):
+        # Cells of this row or column, starting at the edge tiles move towards
+        if direction == 0:
+            cells = [(k, line) for k in range(4)]
+        elif direction == 1:
+            cells = [(line, 3 - k) for k in range(4)]
+        elif direction == 2:
+            cells = [(3 - k, line) for k in range(4)]
+        elif direction == 3:
+            cells = [(line, k) for k in range(4)]
+        else:
+            return []
+
+        target = -1
+        mergeable = None
+        for i, j in cells:
+            exponent = get_exponent(board, i, j)
+            if not exponent:
+                continue
+            if exponent == mergeable and exponent < MAX_EXPONENT:
+                mergeable = None
+            else:
+                target += 1
+                mergeable = exponent
+            paths.append(((i, j), cells[target], 1 << exponent))
+    return paths
@@ -0,0 +1,94 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+
+
+def atomic_write(path, data):
+    """Replace the file at path with data (str or bytes) in one step
+
+    The data goes to a temporary file in the same directory, which is synced
+    and then renamed over path, so a crash leaves either the old file or the
+    new one but never a partial write.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    mode = "wb" if isinstance(data, bytes) else "w"
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class HighScoreStore:
+    """Write-behind storage for the high score
+
+    save() only records the new value; a background timer writes the latest
+    one after delay seconds, so a record game costs one file write per delay
+    instead of one per move. Pending values are also flushed at exit.
+    """
+
+    def __init__(self, path="highscore.json", delay=2.0):
+        self.path = path
+        self.delay = delay
+        # lock guards pending and is never held during the write;
+        # write_lock keeps concurrent flushes in order
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.pending = None
+        self.writing = None
+        self.timer = None
+        atexit.register(self.flush)
+
+    def load(self):
+        """Return the stored high score, including a value not yet written"""
+        with self.lock:
+            if self.pending is not None:
+                return self.pending
+            if self.writing is not None:
+                return self.writing
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                    return data.get("high_score", 0)
+        except Exception:
+            return 0
+        return 0
+
+    def save(self, high_score):
+        """Schedule high_score to be written"""
+        with self.lock:
+            self.pending = high_score
+            if self.timer is None:
+                self.timer = threading.Timer(self.delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Write a pending high score now"""
+        with self.write_lock:
+            with self.lock:
+                high_score = self.pending
+                self.pending = None
+                self.writing = high_score
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+            if high_score is None:
+                return
+            try:
+                atomic_write(self.path, json.dumps({"high_score": high_score}))
+            except Exception:
+                pass
+            with self.lock:
+                self.writing = None
@@ -0,0 +1,74 @@
+"""Replays of recorded games with cheap seeking.
+
+A replay is a starting position plus engine history records (see
+engine.py), such as a journal file holds. Building one plays the game
+through once and keeps the packed board and score every keyframe_interval
+moves, so seek() starts from the nearest keyframe and replays at most
+keyframe_interval moves wherever it lands.
+"""
+from array import array
+
+from engine import SPAWN_RECORD, Game2048Engine
+from journal import read_journal
+
+
+class Replay:
+    """A recorded game that can be shown at any move
+
+    Position n is the board after the n-th move and the tile spawned after
+    it; position 0 is the starting board with its initial spawns.
+    """
+
+    def __init__(self, start, records, keyframe_interval=64):
+        self.start = start
+        self.records = bytes(records)
+        self.keyframe_interval = keyframe_interval
+
+        # ends[n] is the offset just past the records of position n
+        self.ends = array("I", (
+            index for index, record in enumerate(self.records) if not record & SPAWN_RECORD
+        ))
+        self.ends.append(len(self.records))
+        self.length = len(self.ends) - 1
+
+        self.engine = Game2048Engine(start.get("seed"))
+        self._restore(start["board"], start["score"], 0)
+        self.engine.replay(self.records[:self.ends[0]])
+        self.keyframe_boards = array("Q")
+        self.keyframe_scores = array("Q")
+        for position in range(0, self.length + 1, keyframe_interval):
+            self._advance(position)
+            self.keyframe_boards.append(self.engine.board)
+            self.keyframe_scores.append(self.engine.score)
+
+    @classmethod
+    def from_journal(cls, path, keyframe_interval=64):
+        """Build the replay of a journal file"""
+        start, records = read_journal(path)
+        return cls(start, records, keyframe_interval)
+
+    def _restore(self, board, score, position):
+        """Put the engine at a position whose board and score are known"""
+        self.engine.board = board
+        self.engine.score = score
+        self.engine.moves_count = self.start["moves_count"] + position
+        self.engine.history = bytearray()
+        self.position = position
+
+    def _advance(self, position):
+        """Replay the records from the current position up to a later one"""
+        self.engine.replay(self.records[self.ends[self.position]:self.ends[position]])
+        self.position = position
+
+    def seek(self, position):
+        """Return the engine showing position, clamped to the recorded moves
+
+        The same engine is updated and returned on every call.
+        """
+        position = min(max(position, 0), self.length)
+        keyframe = position // self.keyframe_interval
+        start = keyframe * self.keyframe_interval
+        if not start <= self.position <= position:
+            self._restore(self.keyframe_boards[keyframe], self.keyframe_scores[keyframe], start)
+        self._advance(position)
+        return self.engine
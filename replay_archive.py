@@ -0,0 +1,206 @@
+"""Bit-packed game records and block-compressed replay archives.
+
+encode_game() turns a start position and engine history records (see
+engine.py) into:
+
+    flags          B   FLAG_SEEDED when the spawns are left out,
+                       FLAG_HAS_SEED when the game has a seed
+    leading_spawns B   spawns before the first move
+    board          Q   starting board
+    score          Q
+    moves_count    I
+    seed           Q   0 without FLAG_HAS_SEED
+    spawn_count    I   tiles spawned before the starting board
+    move_count     I
+
+followed by the moves at 2 bits each, four to a byte with the first in the
+low bits, and then one byte per spawn (cell | (exponent - 1) << 4). A game
+whose spawns all came from its seed (see rng.py) stores no spawns at all;
+decoding regenerates them.
+
+An archive is ARCHIVE_MAGIC followed by blocks of about block_size bytes of
+encoded games, each block zlib-compressed behind a (compressed size, raw
+size, game count) header. Every game inside a block is prefixed by its size.
+"""
+import os
+import struct
+import zlib
+
+from engine import SPAWN_RECORD, Game2048Engine
+
+FLAG_SEEDED = 0x01
+FLAG_HAS_SEED = 0x02
+GAME_HEADER = struct.Struct("<BBQQIQII")
+GAME_SIZE = struct.Struct("<I")
+
+ARCHIVE_MAGIC = b"2048ARC\x01"
+BLOCK_HEADER = struct.Struct("<III")
+
+# The four directions held by each value of a packed byte
+_UNPACKED = [bytes((b & 3, b >> 2 & 3, b >> 4 & 3, b >> 6)) for b in range(256)]
+
+
+def pack_moves(moves):
+    """Pack directions (0-3) four to a byte"""
+    moves = bytes(moves) + bytes(-len(moves) % 4)
+    return bytes(
+        moves[i] | moves[i + 1] << 2 | moves[i + 2] << 4 | moves[i + 3] << 6
+        for i in range(0, len(moves), 4)
+    )
+
+
+def unpack_moves(data, count):
+    """Return count directions packed by pack_moves"""
+    return b"".join(map(_UNPACKED.__getitem__, data))[:count]
+
+
+def _start_engine(start):
+    """Return an engine at a start position"""
+    engine = Game2048Engine(start.get("seed"))
+    engine.board = start["board"]
+    engine.score = start["score"]
+    engine.moves_count = start["moves_count"]
+    engine.spawn_count = start.get("spawn_count", 0)
+    return engine
+
+
+def _seeded_records(start, leading_spawns, moves):
+    """Return the history of a game whose spawns all come from its seed"""
+    engine = _start_engine(start)
+    for _ in range(leading_spawns):
+        engine.add_random_tile()
+    for direction in moves:
+        engine.move(direction)
+        engine.add_random_tile()
+    return engine.history
+
+
+def encode_game(start, records):
+    """Return the packed form of a start position and its history records
+
+    start is a dict like journal.read_journal returns. The records must be
+    some spawns followed by moves that each spawned one tile, as every
+    journaled game is.
+    """
+    records = bytes(records)
+    moves = records.translate(None, bytes(range(SPAWN_RECORD, 256)))
+    leading_spawns = len(records) - len(records.lstrip(bytes(range(SPAWN_RECORD, 256))))
+    spawns = records[leading_spawns + 1::2]
+    if (records[leading_spawns::2] != moves or len(spawns) != len(moves)
+            or leading_spawns > 255):
+        raise ValueError("Records are not spawns followed by move and spawn pairs")
+
+    seed = start.get("seed")
+    flags = 0
+    if seed is not None:
+        flags |= FLAG_HAS_SEED
+        if _seeded_records(start, leading_spawns, moves) == records:
+            flags |= FLAG_SEEDED
+    header = GAME_HEADER.pack(
+        flags,
+        leading_spawns,
+        start["board"],
+        start["score"],
+        start["moves_count"],
+        seed or 0,
+        start.get("spawn_count", 0),
+        len(moves),
+    )
+    data = header + pack_moves(moves)
+    if not flags & FLAG_SEEDED:
+        data += bytes(record & 0x1F for record in records[:leading_spawns] + spawns)
+    return data
+
+
+def decode_game(data):
+    """Return (start, records) of a game packed by encode_game"""
+    (flags, leading_spawns, board, score, moves_count, seed, spawn_count,
+     move_count) = GAME_HEADER.unpack_from(data)
+    start = {
+        "board": board,
+        "score": score,
+        "moves_count": moves_count,
+        "seed": seed if flags & FLAG_HAS_SEED else None,
+        "spawn_count": spawn_count,
+    }
+    offset = GAME_HEADER.size
+    packed_size = -(-move_count // 4)
+    moves = unpack_moves(data[offset:offset + packed_size], move_count)
+    if len(moves) != move_count:
+        raise ValueError("Truncated game record")
+    if flags & FLAG_SEEDED:
+        return start, bytes(_seeded_records(start, leading_spawns, moves))
+
+    spawns = bytes(spawn | SPAWN_RECORD for spawn in data[offset + packed_size:])
+    if len(spawns) != leading_spawns + move_count:
+        raise ValueError("Truncated game record")
+    records = bytearray(spawns[:leading_spawns])
+    pairs = bytearray(2 * move_count)
+    pairs[0::2] = moves
+    pairs[1::2] = spawns[leading_spawns:]
+    records += pairs
+    return start, bytes(records)
+
+
+def write_archive(path, games, block_size=1 << 20, level=6):
+    """Write (start, records) pairs to a block-compressed archive
+
+    Returns the number of games written. The archive replaces path only once
+    it is complete.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    block = bytearray()
+    block_games = 0
+
+    def write_block(f):
+        compressed = zlib.compress(block, level)
+        f.write(BLOCK_HEADER.pack(len(compressed), len(block), block_games))
+        f.write(compressed)
+
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(ARCHIVE_MAGIC)
+            for start, records in games:
+                data = encode_game(start, records)
+                block += GAME_SIZE.pack(len(data))
+                block += data
+                block_games += 1
+                count += 1
+                if len(block) >= block_size:
+                    write_block(f)
+                    block.clear()
+                    block_games = 0
+            if block_games:
+                write_block(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
+
+
+def read_archive(path):
+    """Yield the (start, records) pairs of an archive, one block in memory at a time"""
+    with open(path, "rb") as f:
+        if f.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC:
+            raise ValueError("Not a replay archive")
+        while True:
+            header = f.read(BLOCK_HEADER.size)
+            if not header:
+                return
+            if len(header) != BLOCK_HEADER.size:
+                raise ValueError("Truncated archive")
+            compressed_size, raw_size, game_count = BLOCK_HEADER.unpack(header)
+            block = zlib.decompress(f.read(compressed_size))
+            if len(block) != raw_size:
+                raise ValueError("Corrupt archive block")
+            offset = 0
+            for _ in range(game_count):
+                (size,) = GAME_SIZE.unpack_from(block, offset)
+                offset += GAME_SIZE.size
+                yield decode_game(block[offset:offset + size])
+                offset += size
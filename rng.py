@@ -0,0 +1,50 @@
+"""Counter-based random numbers for tile spawns.
+
+The k-th spawn of a game with seed s is drawn from splitmix64 applied to
+(s, k) alone. A game is therefore fully determined by its seed and its
+moves, any engine copy continues the same sequence whichever thread runs
+it, and restoring a game only needs the seed and its spawn count.
+derive_seed() gives independent streams, e.g. one per worker or per batch
+game, from a single root seed.
+"""
+import os
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+# Keeps derived seeds apart from the spawn values of the root seed's own game
+STREAM_SALT = 0x5851F42D4C957F2D
+# A spawn is a 4 when the low 32 bits of its value fall below this (p = 0.3)
+FOUR_THRESHOLD = int(0.3 * 2 ** 32)
+
+
+def mix64(z):
+    """splitmix64 finalizer"""
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+    return z ^ (z >> 31)
+
+
+def random64(seed, counter):
+    """Return the counter-th 64-bit value of the stream of seed"""
+    return mix64((seed + (counter + 1) * GOLDEN_GAMMA) & MASK64)
+
+
+def new_seed():
+    """Return a fresh seed from the operating system"""
+    return int.from_bytes(os.urandom(8), "little")
+
+
+def derive_seed(root_seed, index):
+    """Return the seed of the index-th independent stream under root_seed"""
+    return random64(root_seed ^ STREAM_SALT, index)
+
+
+def spawn_choice(seed, counter, empty_count):
+    """Return (k, exponent) for the counter-th spawn of a game
+
+    The new tile is 2**exponent and goes on the k-th empty cell, counting
+    in cell order, with k uniform over range(empty_count).
+    """
+    value = random64(seed, counter)
+    k = ((value >> 32) * empty_count) >> 32
+    return k, 2 if (value & 0xFFFFFFFF) < FOUR_THRESHOLD else 1
@@ -0,0 +1,127 @@
+import json
+import os
+
+from persistence import atomic_write
+from savefile import BINARY_EXTENSION, read_save
+
+SAVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saved")
+CATALOG_NAME = ".catalog.json"
+CATALOG_VERSION = 1
+
+# Load dialog sort orders: label -> (metadata field, descending)
+SORT_ORDERS = {
+    "Newest": ("timestamp", True),
+    "Score": ("score", True),
+    "Max tile": ("max_tile", True),
+    "Moves": ("moves", True),
+    "Name": ("name", False),
+}
+
+
+def save_metadata(game_state):
+    """Return the catalog fields for a game state"""
+    return {
+        "score": game_state["score"],
+        "max_tile": max(max(row) for row in game_state["grid"]),
+        "moves": game_state["moves_count"],
+        "timestamp": game_state.get("saved_at", 0),
+    }
+
+
+class SaveCatalog:
+    """Index of the saved games in one directory
+
+    Score, max tile, move count and save time of every save are kept in a
+    single catalog file next to the saves. save_game updates it whenever it
+    writes a file, and refresh() only opens saves whose size or modification
+    time no longer match their entry, so listing thousands of saves does not
+    parse thousands of files.
+    """
+
+    def __init__(self, save_dir=SAVE_DIR):
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, CATALOG_NAME)
+        self.entries = self._read()
+
+    def _read(self):
+        """Load the catalog file, starting empty if it is missing or stale"""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION:
+                return data["saves"]
+        except Exception:
+            pass
+        return {}
+
+    def _write(self):
+        """Persist the catalog, ignoring failures since it can be rebuilt"""
+        try:
+            os.makedirs(self.save_dir, exist_ok=True)
+            atomic_write(self.path, json.dumps({"version": CATALOG_VERSION, "saves": self.entries}))
+        except OSError:
+            pass
+
+    def _entry(self, name, metadata, stat):
+        """Build a catalog entry tied to a file's current size and mtime"""
+        entry = dict(metadata, name=name, size=stat.st_size, mtime=stat.st_mtime)
+        if not entry.get("timestamp"):
+            entry["timestamp"] = stat.st_mtime
+        return entry
+
+    def _index_file(self, name, stat):
+        """Read one save file to build its entry; invalid files are remembered too"""
+        try:
+            metadata = save_metadata(read_save(os.path.join(self.save_dir, name)))
+        except Exception:
+            return {"name": name, "size": stat.st_size, "mtime": stat.st_mtime, "invalid": True}
+        return self._entry(name, metadata, stat)
+
+    def record(self, name, metadata):
+        """Add or update the entry of a save that was just written"""
+        stat = os.stat(os.path.join(self.save_dir, name))
+        self.entries[name] = self._entry(name, metadata, stat)
+        self._write()
+
+    def is_save_file(self, name):
+        return name.lower().endswith((".json", BINARY_EXTENSION)) and not name.startswith(".")
+
+    def refresh(self):
+        """Bring the catalog in line with the files on disk"""
+        changed = False
+        seen = set()
+        try:
+            with os.scandir(self.save_dir) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    if not self.is_save_file(name) or not dir_entry.is_file():
+                        continue
+                    seen.add(name)
+                    stat = dir_entry.stat()
+                    entry = self.entries.get(name)
+                    if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                        continue
+                    self.entries[name] = self._index_file(name, stat)
+                    changed = True
+        except FileNotFoundError:
+            pass
+
+        for name in set(self.entries) - seen:
+            del self.entries[name]
+            changed = True
+        if changed:
+            self._write()
+
+    def sorted_entries(self, order="Newest"):
+        """Return the valid entries in the given SORT_ORDERS order"""
+        field, descending = SORT_ORDERS[order]
+        entries = [entry for entry in self.entries.values() if not entry.get("invalid")]
+        entries.sort(key=lambda entry: entry[field], reverse=descending)
+        return entries
+
+    def page(self, index, size, order="Newest"):
+        """Return (entries, page_count) for one page of the sorted catalog"""
+        entries = self.sorted_entries(order)
+        page_count = max(1, -(-len(entries) // size))
+        index = min(max(index, 0), page_count - 1)
+        return entries[index * size:(index + 1) * size], page_count
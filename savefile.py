@@ -0,0 +1,119 @@
+"""Compact binary save files.
+
+A binary save is one fixed-size little-endian header, optionally followed
+by a move log of one direction byte per move:
+
+    magic       4s  b"2048"
+    version     B   SAVE_VERSION
+    flags       B   FLAG_MOVE_LOG when a move log follows the header,
+                    FLAG_SEED when seed and spawn_count are set
+    reserved    H
+    board       Q   packed board (see bitboard.py)
+    score       Q
+    high_score  Q
+    moves_count I
+    log_length  I   number of logged moves
+    start_time  d
+    elapsed     d
+    saved_at    d
+    seed        Q   spawn seed (see rng.py), from version 2
+    spawn_count I   tiles spawned so far, from version 2
+
+Loading takes one read and one struct unpack. read_save() also accepts the
+JSON saves and tells the formats apart by the magic bytes.
+"""
+import json
+import struct
+
+from bitboard import to_bitboard, to_grid
+from persistence import atomic_write
+
+MAGIC = b"2048"
+SAVE_VERSION = 2
+FLAG_MOVE_LOG = 0x01
+FLAG_SEED = 0x02
+HEADER = struct.Struct("<4sBBHQQQIIdddQI")
+HEADER_V1 = struct.Struct("<4sBBHQQQIIddd")
+
+# Saves whose name ends with this extension are written in the binary format
+BINARY_EXTENSION = ".2048"
+
+
+def pack_save(game_state, move_log=b""):
+    """Return the binary save of a game state dict as used by the JSON saves"""
+    board = game_state["board"] if "board" in game_state else to_bitboard(game_state["grid"])
+    flags = FLAG_MOVE_LOG if move_log else 0
+    if game_state.get("seed") is not None:
+        flags |= FLAG_SEED
+    header = HEADER.pack(
+        MAGIC,
+        SAVE_VERSION,
+        flags,
+        0,
+        board,
+        game_state["score"],
+        game_state.get("high_score", 0),
+        game_state["moves_count"],
+        len(move_log),
+        game_state.get("start_time", 0.0),
+        game_state.get("elapsed_time", 0.0),
+        game_state.get("saved_at", 0.0),
+        game_state.get("seed") or 0,
+        game_state.get("spawn_count", 0),
+    )
+    return header + bytes(move_log)
+
+
+def unpack_save(data):
+    """Return the game state dict stored in a binary save
+
+    Besides the JSON save fields the dict holds the packed "board" and the
+    "move_log" bytes (empty when the save has none).
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a binary save file")
+    if len(data) < HEADER_V1.size:
+        raise ValueError("Truncated save file")
+    version = data[len(MAGIC)]
+    header = {1: HEADER_V1, SAVE_VERSION: HEADER}.get(version)
+    if header is None:
+        raise ValueError(f"Unsupported save version {version}")
+    if len(data) < header.size:
+        raise ValueError("Truncated save file")
+    fields = header.unpack_from(data)
+    (_, _, flags, _, board, score, high_score, moves_count, log_length,
+     start_time, elapsed_time, saved_at) = fields[:12]
+
+    move_log = b""
+    if flags & FLAG_MOVE_LOG:
+        move_log = data[header.size:header.size + log_length]
+        if len(move_log) != log_length:
+            raise ValueError("Truncated move log")
+    game_state = {
+        "board": board,
+        "grid": to_grid(board),
+        "score": score,
+        "high_score": high_score,
+        "moves_count": moves_count,
+        "start_time": start_time,
+        "elapsed_time": elapsed_time,
+        "saved_at": saved_at,
+        "move_log": move_log,
+    }
+    if flags & FLAG_SEED:
+        game_state["seed"], game_state["spawn_count"] = fields[12:]
+    return game_state
+
+
+def write_save(path, game_state, move_log=b""):
+    """Atomically write a binary save"""
+    atomic_write(path, pack_save(game_state, move_log))
+
+
+def read_save(path):
+    """Return the game state dict of a binary or JSON save file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data.startswith(MAGIC):
+        return unpack_save(data)
+    return json.loads(data)
@@ -0,0 +1,89 @@
+"""Procedural sound effects as raw signed 16-bit PCM.
+
+Nothing here imports pygame; audio.SoundPlayer turns the buffers into
+mixer sounds. Generated buffers can be cached on disk so that later runs
+skip synthesis.
+"""
+import array
+import math
+import os
+
+SAMPLE_RATE = 22050
+SYNTH_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", f"sounds-v{SYNTH_VERSION}")
+
+# Merge sounds rise by a whole tone per tile exponent
+MERGE_LEVELS = range(1, 16)
+
+
+def tone(frequency, duration, rate, volume=0.4, decay=8.0, end_frequency=None):
+    """Return a decaying sine tone, optionally sweeping to end_frequency"""
+    count = int(duration * rate)
+    end_frequency = frequency if end_frequency is None else end_frequency
+    samples = array.array("h", bytes(2 * count))
+    phase = 0.0
+    for n in range(count):
+        t = n / count
+        phase += 2 * math.pi * (frequency + (end_frequency - frequency) * t) / rate
+        # Short linear attack avoids a click at the start of every sound
+        envelope = min(1.0, n / (0.005 * rate)) * math.exp(-decay * t)
+        samples[n] = int(32767 * volume * envelope * math.sin(phase))
+    return samples
+
+
+def notes(frequencies, note_duration, rate, **kwargs):
+    """Return a sequence of tones played one after another"""
+    samples = array.array("h")
+    for frequency in frequencies:
+        samples.extend(tone(frequency, note_duration, rate, **kwargs))
+    return samples
+
+
+def synthesize(name, level=0, rate=SAMPLE_RATE):
+    """Return the mono samples of a sound effect"""
+    if name == "move":
+        return tone(520, 0.05, rate, volume=0.25, decay=10.0, end_frequency=380)
+    if name == "merge":
+        frequency = 261.63 * 2 ** ((max(level, 1) - 1) / 6)
+        return tone(frequency, 0.12, rate, volume=0.4, decay=6.0, end_frequency=frequency * 1.5)
+    if name == "game_over":
+        return notes([392.0, 329.63, 261.63, 196.0], 0.18, rate, decay=3.0)
+    if name == "win":
+        return notes([523.25, 659.25, 783.99, 1046.5], 0.12, rate, decay=3.0)
+    if name == "tutorial":
+        return notes([659.25, 987.77], 0.1, rate, volume=0.3, decay=4.0)
+    raise ValueError(f"Unknown sound {name!r}")
+
+
+def to_pcm(samples, channels=1):
+    """Return native-endian 16-bit PCM bytes with each sample on every channel"""
+    if channels > 1:
+        interleaved = array.array("h", bytes(2 * len(samples) * channels))
+        for channel in range(channels):
+            interleaved[channel::channels] = samples
+        samples = interleaved
+    return samples.tobytes()
+
+
+def load_pcm(name, level=0, rate=SAMPLE_RATE, channels=1, cache_dir=CACHE_DIR):
+    """Return the PCM bytes of a sound effect, from the disk cache when possible"""
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, f"{name}-{level}-{rate}-{channels}.pcm")
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            pass
+
+    pcm = to_pcm(synthesize(name, level, rate), channels)
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(pcm)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    return pcm
@@ -0,0 +1,94 @@
+import queue
+import threading
+
+
+class Job:
+    """A unit of work for EngineWorker that can be cancelled at any time"""
+
+    def __init__(self, func, on_result):
+        self.func = func
+        self.on_result = on_result
+        self.cancelled = threading.Event()
+        self.progress = None
+
+    def cancel(self):
+        """Stop the job as soon as it checks should_stop and drop its result"""
+        self.cancelled.set()
+
+    def should_stop(self):
+        return self.cancelled.is_set()
+
+    def report(self, value):
+        """Publish an intermediate result for the Tk thread to read
+
+        Only the latest value is kept, so a fast job never floods the UI.
+        """
+        self.progress = value
+
+
+class EngineWorker:
+    """Runs engine computations on a background thread
+
+    Jobs run one at a time on a daemon thread. Their results are queued and
+    handed to on_result on the Tk thread by polling with root.after, so
+    callbacks may touch widgets freely and the mainloop never blocks on a
+    search. Long jobs should poll job.should_stop() to honour cancellation.
+    A job that raises is not dropped: its on_result gets None, so callers
+    can clean up after a failure as after an empty result.
+    """
+
+    def __init__(self, root, poll_interval=15):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0
+        self.poll_id = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, func, on_result):
+        """Queue func(job) to run in the background and return its Job"""
+        job = Job(func, on_result)
+        self.pending += 1
+        self.jobs.put(job)
+        if self.poll_id is None:
+            self.poll_id = self.root.after(self.poll_interval, self.poll)
+        return job
+
+    def _run(self):
+        """Worker thread loop"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            result = None
+            if not job.should_stop():
+                try:
+                    result = job.func(job)
+                except Exception:
+                    # Delivered as an empty result so the caller can clean up
+                    result = None
+            self.results.put((job, result))
+
+    def poll(self):
+        """Deliver finished results on the Tk thread"""
+        self.poll_id = None
+        while True:
+            try:
+                job, result = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if not job.should_stop():
+                job.on_result(result)
+
+        if self.pending:
+            self.poll_id = self.root.after(self.poll_interval, self.poll)
+
+    def shutdown(self):
+        """Stop polling and let the worker thread exit"""
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+        self.jobs.put(None)